@@ -3,8 +3,7 @@ from homeassistant import config_entries
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.httpx_client import get_async_client
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from pyvikunja.api import VikunjaAPI, APIError
 
 from .const import (
@@ -17,8 +16,12 @@ from .const import (
     CONF_STRICT_SSL,
     CONF_SELECTED_PROJECTS,
     CONF_ALL_PROJECTS,
+    CONF_PUSH_UPDATES,
 )
+from .client import async_get_vikunja_client, async_release_vikunja_client
 from .coordinator import VikunjaDataUpdateCoordinator
+from .store import snapshot_store
+from .webhook import async_register_webhook, async_unregister_webhook
 
 PLATFORMS = [
     Platform.SENSOR,
@@ -46,17 +49,27 @@ async def async_setup_entry(hass, entry):
         return False
 
     # Initialize Vikunja API client
-    client = get_async_client(hass, verify_ssl=strict_ssl)
+    client = async_get_vikunja_client(hass, entry)
+    entry.async_on_unload(lambda: async_release_vikunja_client(hass, entry))
     vikunja_api = VikunjaAPI(base_url, token, strict_ssl, client)
 
-    try:
-        await vikunja_api.ping()
-    except (httpx.HTTPError, APIError) as e:
-        LOGGER.error(f"Error setting up Vikunja at {vikunja_api.web_ui_link}: {e}")
-        raise ConfigEntryNotReady from e
-
     coordinator = VikunjaDataUpdateCoordinator(hass, entry, vikunja_api, secs_interval)
-    await coordinator.async_config_entry_first_refresh()
+
+    # Start from the last synced data when there is some, so entities don't wait for Vikunja. The
+    # refresh in the background then marks them unavailable or asks for a new token if it fails
+    if not await coordinator.async_restore_snapshot():
+        try:
+            await vikunja_api.ping()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (401, 403):
+                raise ConfigEntryAuthFailed from e
+            LOGGER.error(f"Error setting up Vikunja at {vikunja_api.web_ui_link}: {e}")
+            raise ConfigEntryNotReady from e
+        except (httpx.HTTPError, APIError) as e:
+            LOGGER.error(f"Error setting up Vikunja at {vikunja_api.web_ui_link}: {e}")
+            raise ConfigEntryNotReady from e
+
+        await coordinator.async_config_entry_first_refresh()
 
     # Update the entry title to include the host
     new_title = f"Vikunja ({vikunja_api.web_ui_link})"
@@ -70,7 +83,19 @@ async def async_setup_entry(hass, entry):
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    LOGGER.info("Vikunja setup complete")
+    if entry.data.get(CONF_PUSH_UPDATES, False):
+        async_register_webhook(hass, entry, coordinator)
+        entry.async_on_unload(lambda: async_unregister_webhook(hass, entry))
+
+    if coordinator.restored_from_snapshot:
+        # Reconcile the restored data once the platforms listen for updates
+        entry.async_create_background_task(hass, coordinator.async_refresh(), "vikunja_initial_refresh")
+        LOGGER.info("Vikunja setup complete from the last synced data, refreshing in the background")
+    else:
+        LOGGER.info(
+            f"Vikunja setup complete after {coordinator.sync_count} sync(s) "
+            f"and {coordinator.api_calls} API call(s)"
+        )
     return True
 
 
@@ -81,6 +106,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored data of a removed Vikunja integration."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
+
+
 async def async_migrate_entry(hass, entry: config_entries.ConfigEntry) -> bool:
     """Migrate old entry to the new version."""
     new_data = {**entry.data}
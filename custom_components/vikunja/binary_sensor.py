@@ -5,9 +5,9 @@ from pyvikunja.api import VikunjaAPI
 from pyvikunja.models.task import Task
 
 from custom_components.vikunja import LOGGER
-from custom_components.vikunja.const import DATA_TASKS_KEY, DOMAIN
+from custom_components.vikunja.const import DOMAIN
 from custom_components.vikunja.sensors.TaskSensors import VikunjaTaskDoneSensor, VikunjaTaskOverdueSensor
-from custom_components.vikunja.const import CONF_TASKS_AS_DEVICES
+from custom_components.vikunja.sensors.vikunja_entity import async_setup_task_entities
 
 
 def get_binary_sensors_for_task(coordinator, base_url, task_id):
@@ -29,17 +29,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     vikunja_api: VikunjaAPI = vikunja_data["api"]
     coordinator = vikunja_data["coordinator"]
 
-    # Create sensor entities
-    entities = []
-
-    if entry.data.get(CONF_TASKS_AS_DEVICES, True):
-        tasks = coordinator.data[DATA_TASKS_KEY].keys()
-        for task_id in tasks:
-            LOGGER.info(f"Task is {task_id}")
-            entities.extend(get_binary_sensors_for_task(coordinator, vikunja_api.web_ui_link, task_id))
+    entities = async_setup_task_entities(
+        coordinator, entry, async_add_entities,
+        lambda task_id: get_binary_sensors_for_task(coordinator, vikunja_api.web_ui_link, task_id),
+    )
 
     if not entities:
         LOGGER.warning("No entities created")
 
-    async_add_entities(entities, True)
+    # The first refresh already loaded the data, so no update before add
+    async_add_entities(entities)
     LOGGER.info(f"Added {len(entities)} Vikunja binary sensors.")
@@ -0,0 +1,100 @@
+from urllib.parse import urlsplit
+
+import httpx
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.httpx_client import SERVER_SOFTWARE, USER_AGENT
+from homeassistant.util.ssl import client_context, create_no_verify_ssl_context
+
+from custom_components.vikunja.const import (
+    DOMAIN,
+    LOGGER,
+    CONF_BASE_URL,
+    CONF_STRICT_SSL,
+    CONF_MAX_CONNECTIONS,
+    CONF_KEEPALIVE_EXPIRY,
+    CONF_HTTP2,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_KEEPALIVE_EXPIRY,
+)
+
+DATA_CLIENTS = f"{DOMAIN}_clients"
+
+
+class SharedClient:
+    """An httpx client to one Vikunja host and the config entries using it."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        self.entry_ids: set[str] = set()
+        self.unsub_close = None
+
+
+def _client_key(entry: ConfigEntry) -> tuple:
+    base_url = entry.data.get(CONF_BASE_URL) or ""
+    host = urlsplit(base_url if "://" in base_url else f"https://{base_url}").netloc.lower()
+    return (
+        host,
+        entry.data.get(CONF_STRICT_SSL, True),
+        entry.data.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS),
+        entry.data.get(CONF_KEEPALIVE_EXPIRY, DEFAULT_KEEPALIVE_EXPIRY),
+        entry.data.get(CONF_HTTP2, False),
+    )
+
+
+def _create_client(verify_ssl: bool, max_connections: int, keepalive_expiry: int, http2: bool) -> httpx.AsyncClient:
+    kwargs = {
+        "verify": client_context() if verify_ssl else create_no_verify_ssl_context(),
+        "headers": {USER_AGENT: SERVER_SOFTWARE},
+        # Every connection may be kept alive, so parallel syncs reuse them instead of redoing the TLS handshake
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    }
+
+    if http2:
+        try:
+            return httpx.AsyncClient(http2=True, **kwargs)
+        except ImportError:
+            LOGGER.warning("HTTP/2 needs the h2 package, connecting to Vikunja over HTTP/1.1")
+
+    return httpx.AsyncClient(**kwargs)
+
+
+@callback
+def async_get_vikunja_client(hass: HomeAssistant, entry: ConfigEntry) -> httpx.AsyncClient:
+    """Return the client of the entry's Vikunja host, shared by entries with the same connection settings."""
+    clients: dict[tuple, SharedClient] = hass.data.setdefault(DATA_CLIENTS, {})
+    key = _client_key(entry)
+
+    shared = clients.get(key)
+    if shared is None:
+        _, verify_ssl, max_connections, keepalive_expiry, http2 = key
+        shared = clients[key] = SharedClient(_create_client(verify_ssl, max_connections, keepalive_expiry, http2))
+
+        async def _async_close_client(event: Event) -> None:
+            await shared.client.aclose()
+
+        shared.unsub_close = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_client)
+        LOGGER.debug(f"Created a Vikunja client for {key[0]}")
+
+    shared.entry_ids.add(entry.entry_id)
+    return shared.client
+
+
+async def async_release_vikunja_client(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Stop using the entry's client, closing it once no entry uses it."""
+    clients: dict[tuple, SharedClient] = hass.data.get(DATA_CLIENTS, {})
+
+    for key, shared in list(clients.items()):
+        shared.entry_ids.discard(entry.entry_id)
+        if shared.entry_ids:
+            continue
+
+        del clients[key]
+        shared.unsub_close()
+        await shared.client.aclose()
+        LOGGER.debug(f"Closed the Vikunja client for {key[0]}")
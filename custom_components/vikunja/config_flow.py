@@ -1,6 +1,7 @@
 import httpx
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.components import webhook
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
@@ -9,6 +10,7 @@ from homeassistant.helpers.httpx_client import get_async_client
 from pyvikunja.api import VikunjaAPI
 
 from . import VikunjaDataUpdateCoordinator
+from .util import remove_project_summary_entities
 from .const import (
     CONF_TASKS_AS_DEVICES,
     DOMAIN,
@@ -20,6 +22,28 @@ from .const import (
     CONF_STRICT_SSL,
     CONF_SELECTED_PROJECTS,
     CONF_ALL_PROJECTS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    CONF_INCREMENTAL_SYNC,
+    CONF_PROJECT_SUMMARY,
+    CONF_ADAPTIVE_POLLING,
+    CONF_MIN_INTERVAL,
+    CONF_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_MAX_INTERVAL,
+    CONF_PUSH_UPDATES,
+    CONF_WEBHOOK_ID,
+    CONF_WEBHOOK_SECRET,
+    CONF_SYNC_TIMEOUT,
+    DEFAULT_SYNC_TIMEOUT,
+    CONF_SHARDED_SYNC,
+    CONF_SYNC_WINDOW,
+    DEFAULT_SYNC_WINDOW,
+    CONF_MAX_CONNECTIONS,
+    CONF_KEEPALIVE_EXPIRY,
+    CONF_HTTP2,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_KEEPALIVE_EXPIRY,
     LOGGER,
 )
 
@@ -109,6 +133,7 @@ class VikunjaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             selected_projects = user_input.get(CONF_SELECTED_PROJECTS, [])
             hide_done = user_input.get(CONF_HIDE_DONE, True)
             tasks_as_devices = user_input.get(CONF_TASKS_AS_DEVICES, True)
+            project_summary = user_input.get(CONF_PROJECT_SUMMARY, False)
             
             if not selected_projects:
                 errors["base"] = "no_projects_selected"
@@ -120,6 +145,7 @@ class VikunjaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_SELECTED_PROJECTS: selected_projects,
                         CONF_HIDE_DONE: hide_done,
                         CONF_TASKS_AS_DEVICES: tasks_as_devices,
+                        CONF_PROJECT_SUMMARY: project_summary,
                     },
                 )
 
@@ -144,6 +170,7 @@ class VikunjaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 ),
                 vol.Optional(CONF_HIDE_DONE, default=True): bool,
                 vol.Optional(CONF_TASKS_AS_DEVICES, default=True): bool,
+                vol.Optional(CONF_PROJECT_SUMMARY, default=False): bool,
             }),
             errors=errors,
             description_placeholders={"project_count": str(len(self._available_projects))},
@@ -197,6 +224,46 @@ class VikunjaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_reauth(self, entry_data) -> FlowResult:
+        """Handle an API token that Vikunja rejected."""
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(self, user_input=None) -> FlowResult:
+        """Ask for a new API token."""
+        errors = {}
+        entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+
+        if user_input is not None:
+            token = user_input[CONF_TOKEN]
+            strict_ssl = entry.data.get(CONF_STRICT_SSL, True)
+
+            client = get_async_client(self.hass, verify_ssl=strict_ssl)
+            api = VikunjaAPI(entry.data[CONF_BASE_URL], token, strict_ssl, client)
+
+            try:
+                await api.ping()
+            except httpx.HTTPError as e:
+                errors['base'] = f"API Error: {e}"
+
+            if not errors:
+                return self.async_update_reload_and_abort(
+                    entry,
+                    data={
+                        **entry.data,
+                        CONF_TOKEN: token,
+                    },
+                )
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema({
+                vol.Required(CONF_TOKEN): selector.TextSelector(
+                    selector.TextSelectorConfig(type=selector.TextSelectorType.PASSWORD)
+                ),
+            }),
+            errors=errors,
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry):
@@ -210,6 +277,7 @@ class VikunjaOptionsFlow(config_entries.OptionsFlow):
     def __init__(self):
         """Initialize options flow."""
         self._available_projects = {}
+        self._data = {}
 
     async def _fetch_projects(self) -> dict:
         """Fetch available projects from Vikunja API."""
@@ -233,36 +301,31 @@ class VikunjaOptionsFlow(config_entries.OptionsFlow):
 
         if user_input is not None:
             selected_projects = user_input.get(CONF_SELECTED_PROJECTS, [])
-            new_hide_done = user_input.get(CONF_HIDE_DONE, True)
-            tasks_as_devices = user_input.get(CONF_TASKS_AS_DEVICES, True)
+            push_updates = user_input.get(CONF_PUSH_UPDATES, False)
+            webhook_secret = user_input.get(CONF_WEBHOOK_SECRET, "")
             
             if not selected_projects:
                 errors["base"] = "no_projects_selected"
+            elif push_updates and not webhook_secret:
+                # Without a secret anyone who can reach Home Assistant could push tasks
+                errors["base"] = "webhook_secret_required"
             else:
-                # Update all settings
-                data = {
+                self._data = {
                     **self.config_entry.data,
                     CONF_SECS_INTERVAL: user_input[CONF_SECS_INTERVAL],
-                    CONF_HIDE_DONE: new_hide_done,
-                    CONF_TASKS_AS_DEVICES: tasks_as_devices,
+                    CONF_HIDE_DONE: user_input.get(CONF_HIDE_DONE, True),
+                    CONF_TASKS_AS_DEVICES: user_input.get(CONF_TASKS_AS_DEVICES, True),
+                    CONF_PROJECT_SUMMARY: user_input.get(CONF_PROJECT_SUMMARY, False),
                     CONF_SELECTED_PROJECTS: selected_projects,
+                    CONF_PUSH_UPDATES: push_updates,
+                    CONF_WEBHOOK_ID: self.config_entry.data.get(CONF_WEBHOOK_ID) or webhook.async_generate_id(),
+                    CONF_WEBHOOK_SECRET: webhook_secret,
                 }
 
-                self.hass.config_entries.async_update_entry(
-                    self.config_entry,
-                    data=data
-                )
-
-                # refresh coordinator to handle entity cleanup
-                hass_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
-                if hass_data and "coordinator" in hass_data:
-                    coordinator: VikunjaDataUpdateCoordinator = hass_data["coordinator"]
-                    await coordinator.async_refresh()
-                else:
-                    # Fallback: reload the config entry if coordinator not available
-                    await self.hass.config_entries.async_reload(self.config_entry.entry_id)
-
-                return self.async_create_entry(title="", data={})
+                # Sync and connection tuning is only offered to users in advanced mode
+                if self.show_advanced_options:
+                    return await self.async_step_advanced()
+                return await self._async_save_options()
 
         # Get currently selected projects
         current_selection = self.config_entry.data.get(CONF_SELECTED_PROJECTS, [CONF_ALL_PROJECTS])
@@ -302,7 +365,103 @@ class VikunjaOptionsFlow(config_entries.OptionsFlow):
                 vol.Required(CONF_SECS_INTERVAL, default=self.config_entry.data.get(CONF_SECS_INTERVAL, 60)): int,
                 vol.Optional(CONF_HIDE_DONE, default=self.config_entry.data.get(CONF_HIDE_DONE, True)): bool,
                 vol.Optional(CONF_TASKS_AS_DEVICES, default=self.config_entry.data.get(CONF_TASKS_AS_DEVICES, True)): bool,
+                vol.Optional(CONF_PROJECT_SUMMARY, default=self.config_entry.data.get(CONF_PROJECT_SUMMARY, False)): bool,
+                vol.Optional(CONF_PUSH_UPDATES, default=self.config_entry.data.get(CONF_PUSH_UPDATES, False)): bool,
+                vol.Optional(CONF_WEBHOOK_SECRET, default=self.config_entry.data.get(CONF_WEBHOOK_SECRET, "")): str,
             }),
             errors=errors,
             description_placeholders={"project_count": str(len(self._available_projects))},
-        )
\ No newline at end of file
+        )
+
+    async def async_step_advanced(self, user_input=None):
+        """Handle the sync and connection tuning of the options flow."""
+        data = self._data
+
+        if user_input is not None:
+            self._data = {
+                **data,
+                CONF_MAX_CONCURRENT_REQUESTS: user_input[CONF_MAX_CONCURRENT_REQUESTS],
+                CONF_INCREMENTAL_SYNC: user_input.get(CONF_INCREMENTAL_SYNC, False),
+                CONF_ADAPTIVE_POLLING: user_input.get(CONF_ADAPTIVE_POLLING, False),
+                CONF_MIN_INTERVAL: user_input[CONF_MIN_INTERVAL],
+                CONF_MAX_INTERVAL: user_input[CONF_MAX_INTERVAL],
+                CONF_SYNC_TIMEOUT: user_input[CONF_SYNC_TIMEOUT],
+                CONF_SHARDED_SYNC: user_input.get(CONF_SHARDED_SYNC, False),
+                CONF_SYNC_WINDOW: user_input[CONF_SYNC_WINDOW],
+                CONF_MAX_CONNECTIONS: user_input[CONF_MAX_CONNECTIONS],
+                CONF_KEEPALIVE_EXPIRY: user_input[CONF_KEEPALIVE_EXPIRY],
+                CONF_HTTP2: user_input.get(CONF_HTTP2, False),
+            }
+            return await self._async_save_options()
+
+        return self.async_show_form(
+            step_id="advanced",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_MAX_CONCURRENT_REQUESTS,
+                    default=data.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS)
+                ): vol.All(int, vol.Range(min=1)),
+                vol.Optional(CONF_INCREMENTAL_SYNC, default=data.get(CONF_INCREMENTAL_SYNC, False)): bool,
+                vol.Optional(CONF_ADAPTIVE_POLLING, default=data.get(CONF_ADAPTIVE_POLLING, False)): bool,
+                vol.Required(
+                    CONF_MIN_INTERVAL, default=data.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+                ): vol.All(int, vol.Range(min=1)),
+                vol.Required(
+                    CONF_MAX_INTERVAL, default=data.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL)
+                ): vol.All(int, vol.Range(min=1)),
+                vol.Required(
+                    CONF_SYNC_TIMEOUT, default=data.get(CONF_SYNC_TIMEOUT, DEFAULT_SYNC_TIMEOUT)
+                ): vol.All(int, vol.Range(min=5)),
+                vol.Optional(CONF_SHARDED_SYNC, default=data.get(CONF_SHARDED_SYNC, False)): bool,
+                vol.Required(
+                    CONF_SYNC_WINDOW, default=data.get(CONF_SYNC_WINDOW, DEFAULT_SYNC_WINDOW)
+                ): vol.All(int, vol.Range(min=60)),
+                vol.Required(
+                    CONF_MAX_CONNECTIONS, default=data.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS)
+                ): vol.All(int, vol.Range(min=1)),
+                vol.Required(
+                    CONF_KEEPALIVE_EXPIRY, default=data.get(CONF_KEEPALIVE_EXPIRY, DEFAULT_KEEPALIVE_EXPIRY)
+                ): vol.All(int, vol.Range(min=0)),
+                vol.Optional(CONF_HTTP2, default=data.get(CONF_HTTP2, False)): bool,
+            }),
+        )
+
+    async def _async_save_options(self):
+        """Save the options and apply them to the running entry."""
+        data = self._data
+        entry_data = self.config_entry.data
+
+        project_summary_changed = data[CONF_PROJECT_SUMMARY] != entry_data.get(CONF_PROJECT_SUMMARY, False)
+        # The webhook is only registered during setup
+        push_changed = (
+            data[CONF_PUSH_UPDATES] != entry_data.get(CONF_PUSH_UPDATES, False)
+            or data[CONF_WEBHOOK_SECRET] != entry_data.get(CONF_WEBHOOK_SECRET, "")
+        )
+        # The client is only created during setup
+        client_changed = (
+            data.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS) != entry_data.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS)
+            or data.get(CONF_KEEPALIVE_EXPIRY, DEFAULT_KEEPALIVE_EXPIRY) != entry_data.get(CONF_KEEPALIVE_EXPIRY, DEFAULT_KEEPALIVE_EXPIRY)
+            or data.get(CONF_HTTP2, False) != entry_data.get(CONF_HTTP2, False)
+        )
+
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data=data
+        )
+
+        if project_summary_changed and not data[CONF_PROJECT_SUMMARY]:
+            await remove_project_summary_entities(self.hass, self.config_entry.entry_id)
+
+        # refresh coordinator to handle entity cleanup
+        hass_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if project_summary_changed or push_changed or client_changed:
+            # Summary entities, the webhook and the client are only set up with the entry
+            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+        elif hass_data and "coordinator" in hass_data:
+            coordinator: VikunjaDataUpdateCoordinator = hass_data["coordinator"]
+            await coordinator.async_refresh()
+        else:
+            # Fallback: reload the config entry if coordinator not available
+            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+
+        return self.async_create_entry(title="", data={})
@@ -1,4 +1,5 @@
 import logging
+from datetime import timedelta
 
 DOMAIN = "vikunja"
 
@@ -10,11 +11,64 @@ CONF_HIDE_DONE = "hide_done"
 CONF_STRICT_SSL = "strict_ssl"
 CONF_SELECTED_PROJECTS = "selected_projects"
 CONF_TASKS_AS_DEVICES = "tasks_as_devices"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_INCREMENTAL_SYNC = "incremental_sync"
+CONF_PROJECT_SUMMARY = "project_summary"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MIN_INTERVAL = "min_seconds_interval"
+CONF_MAX_INTERVAL = "max_seconds_interval"
+CONF_PUSH_UPDATES = "push_updates"
+CONF_WEBHOOK_ID = "webhook_id"
+CONF_WEBHOOK_SECRET = "webhook_secret"
+CONF_SYNC_TIMEOUT = "sync_timeout"
+CONF_SHARDED_SYNC = "sharded_sync"
+CONF_SYNC_WINDOW = "sync_window"
+CONF_MAX_CONNECTIONS = "max_connections"
+CONF_KEEPALIVE_EXPIRY = "keepalive_expiry"
+CONF_HTTP2 = "http2"
 
 # Special value to indicate all projects should be synced
 CONF_ALL_PROJECTS = "__all__"
 
+# Maximum number of project task requests in flight at once during a sync
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+# Connection pool of the Vikunja client, connections idle for longer than the expiry are closed
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30
+
+# Page size used when listing every visible task through the global task endpoint
+BULK_SYNC_PAGE_SIZE = 50
+
+# Use the global task listing when at least this share of all projects is selected,
+# otherwise fetching each selected project is cheaper than discarding most of the listing
+BULK_SYNC_MIN_SELECTED_RATIO = 0.5
+
+# How often an incremental sync still downloads every task, to pick up deleted tasks
+INCREMENTAL_FULL_SYNC_INTERVAL = timedelta(minutes=30)
+
+# Bounds of the adaptive polling interval, in seconds
+DEFAULT_MIN_INTERVAL = 10
+DEFAULT_MAX_INTERVAL = 300
+
+# Polling interval used with push updates, syncs then only reconcile webhooks that were missed
+PUSH_RECONCILE_INTERVAL = timedelta(minutes=15)
+
+# Seconds a single Vikunja request may take, and the default time budget of a whole sync
+REQUEST_TIMEOUT = 10
+DEFAULT_SYNC_TIMEOUT = 30
+
+# Seconds within which a sharded sync refreshes every project at least once
+DEFAULT_SYNC_WINDOW = 600
+
+# Seconds after a dispatched write over which further writes are batched into one dispatch and refresh
+WRITE_COALESCE_WINDOW = 0.5
+
+# Seconds to wait after a change before writing the data snapshot to disk
+SNAPSHOT_SAVE_DELAY = 10
+
 DATA_PROJECTS_KEY = "projects"
 DATA_TASKS_KEY = "tasks"
+DATA_PROJECT_TASKS_KEY = "project_tasks"
 
 LOGGER = logging.getLogger(__package__)
\ No newline at end of file
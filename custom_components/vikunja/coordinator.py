@@ -1,20 +1,71 @@
-from datetime import timedelta
+import asyncio
+import time
+from datetime import timedelta, timezone
+from typing import Callable, Iterable
 
 import async_timeout
+import httpx
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 from pyvikunja.api import VikunjaAPI, APIError
+from pyvikunja.models.project import Project
+from pyvikunja.models.task import Task
 
 from custom_components.vikunja import LOGGER
 from custom_components.vikunja.const import (
     CONF_TASKS_AS_DEVICES,
     DATA_PROJECTS_KEY,
     DATA_TASKS_KEY,
+    DATA_PROJECT_TASKS_KEY,
     CONF_HIDE_DONE,
     CONF_SELECTED_PROJECTS,
     CONF_ALL_PROJECTS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    BULK_SYNC_PAGE_SIZE,
+    BULK_SYNC_MIN_SELECTED_RATIO,
+    CONF_INCREMENTAL_SYNC,
+    INCREMENTAL_FULL_SYNC_INTERVAL,
+    CONF_PROJECT_SUMMARY,
+    CONF_ADAPTIVE_POLLING,
+    CONF_SECS_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_MAX_INTERVAL,
+    CONF_PUSH_UPDATES,
+    PUSH_RECONCILE_INTERVAL,
+    SNAPSHOT_SAVE_DELAY,
+    CONF_SYNC_TIMEOUT,
+    DEFAULT_SYNC_TIMEOUT,
+    CONF_SHARDED_SYNC,
+    CONF_SYNC_WINDOW,
+    DEFAULT_SYNC_WINDOW,
+    WRITE_COALESCE_WINDOW,
 )
-from .util import remove_task_with_entities, remove_project_entities, has_task_devices_entries
+from .derived_fields import DerivedFieldCache
+from .due_scheduler import DueDateScheduler
+from .instrumentation import Instrumentation
+from .project_summary import ProjectSummary, summarize_project_tasks
+from .request_cache import ConditionalRequestCache
+from .shard_scheduler import ShardScheduler
+from .store import snapshot_store, serialize_data, deserialize_data
+from .task_snapshot import TaskSnapshot
+from .util import remove_tasks_and_projects, has_task_devices_entries, gather_with_limit
+
+
+class SyncBudgetExceeded(Exception):
+    """The sync budget ran out before the tasks of a project were fetched."""
+
+    def __init__(self, message: str, tasks: list[TaskSnapshot] | None = None):
+        super().__init__(message)
+        # Tasks of the project on the listing pages fetched before the budget ran out
+        self.tasks = tasks or []
 
 
 class VikunjaDataUpdateCoordinator(DataUpdateCoordinator):
@@ -26,6 +77,66 @@ class VikunjaDataUpdateCoordinator(DataUpdateCoordinator):
         self._vikunja_api = vikunja_api
         self._config_id = config_entry.entry_id
 
+        # Number of syncs run, and of tasks fetched one by one outside the request cache
+        self.sync_count = 0
+        self._task_fetches = 0
+
+        # Phase timings and payload sizes of syncs and dispatches, for diagnostics
+        self.instrumentation = Instrumentation()
+
+        # Projects whose tasks failed to fetch on the last sync, mapped to the error
+        self.failed_projects: dict[int, str] = {}
+        # Projects the sync budget ran out on last time and still hold older data, fetched first next time
+        self.stale_projects: set[int] = set()
+
+        # Latest task `updated` time seen, incremental syncs only ask for tasks changed since then
+        self._updated_high_water = None
+        self._last_full_sync = None
+
+        # Entity factories registered by each platform, used to add entities for new tasks and projects
+        self._task_platforms: list[tuple[AddEntitiesCallback, Callable[[int], list[Entity]]]] = []
+        self._project_platforms: list[tuple[AddEntitiesCallback, Callable[[int], list[Entity]]]] = []
+        self._pending_task_ids: set[int] = set()
+        self._pending_project_ids: set[int] = set()
+
+        # Per-project summaries, computed in one pass over the tasks before each dispatch
+        self.project_summaries: dict[int, ProjectSummary] = {}
+
+        # Repeat info, label and assignee text of every task, derived once per task version
+        self.derived_fields = DerivedFieldCache()
+
+        # Cached check for task entities in the entity registry, None when it has to be recomputed
+        self._has_task_devices: bool | None = None
+
+        # Tasks whose data changed in the last sync, None notifies every listener on the next dispatch
+        self._changed_task_ids: set[int] | None = None
+        self._last_dispatch_success: bool | None = None
+
+        # Flips the overdue state of tasks exactly when their due date passes
+        self._due_scheduler = DueDateScheduler(hass, self._async_update_changed_listeners)
+
+        # Last synced data on disk, entities start from it while the first sync runs in the background
+        self._store = snapshot_store(hass, config_entry.entry_id)
+        self.restored_from_snapshot = False
+
+        # Reuses the parsed projects and tasks of listing pages that did not change
+        self.request_cache = ConditionalRequestCache(vikunja_api)
+
+        # Picks the projects a sharded sync refreshes, all other projects keep their last known tasks
+        self._shards = ShardScheduler()
+
+        # A write is dispatched straight away, writes following it within a short window are
+        # dispatched together at the end of it, with at most one refresh for the batch
+        self._write_debouncer = Debouncer(
+            hass, LOGGER, cooldown=WRITE_COALESCE_WINDOW, immediate=True, function=self._async_flush_writes
+        )
+        self._written_task_ids: set[int] = set()
+        self._write_refresh_requested = False
+        self.writes = 0
+        self.write_dispatches = 0
+        self.write_refresh_requests = 0
+        self.write_refreshes = 0
+
         super().__init__(
             hass,
             LOGGER,
@@ -34,6 +145,247 @@ class VikunjaDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=seconds_interval),
         )
 
+    @callback
+    def async_add_task_platform(
+            self, async_add_entities: AddEntitiesCallback, entity_factory: Callable[[int], list[Entity]]
+    ) -> None:
+        """Register how a platform creates the entities of a task, so new tasks can be added without a reload."""
+        self._task_platforms.append((async_add_entities, entity_factory))
+        # The platform just added its task entities, recheck the registry on the next sync
+        self._has_task_devices = None
+
+    @callback
+    def async_add_project_platform(
+            self, async_add_entities: AddEntitiesCallback, entity_factory: Callable[[int], list[Entity]]
+    ) -> None:
+        """Register how a platform creates the entities of a project, so new projects can be added without a reload."""
+        self._project_platforms.append((async_add_entities, entity_factory))
+
+    @callback
+    def _async_add_pending_entities(self) -> None:
+        """Add the entities of tasks and projects that appeared since the last update."""
+        task_ids = [task_id for task_id in self._pending_task_ids if task_id in self.data[DATA_TASKS_KEY]]
+        project_ids = [project_id for project_id in self._pending_project_ids if project_id in self.data[DATA_PROJECTS_KEY]]
+        self._pending_task_ids.clear()
+        self._pending_project_ids.clear()
+
+        for ids, platforms in ((task_ids, self._task_platforms), (project_ids, self._project_platforms)):
+            if not ids:
+                continue
+
+            for async_add_entities, entity_factory in platforms:
+                entities = [entity for item_id in ids for entity in entity_factory(item_id)]
+                if entities:
+                    async_add_entities(entities)
+
+        if task_ids and self._task_platforms:
+            self._has_task_devices = True
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Add entities for new tasks and projects, then update the listeners affected by the last sync.
+
+        Task entities listen with their task ID as context and are only updated when that
+        task changed. Listeners without a context, and every listener when availability
+        flips, are always updated.
+        """
+        start = time.perf_counter()
+        now = dt_util.now()
+
+        if self.data is not None:
+            if self.config_entry.data.get(CONF_PROJECT_SUMMARY, False):
+                self._update_project_summaries(now)
+            self._async_add_pending_entities()
+
+        notify_all = self._changed_task_ids is None or self.last_update_success != self._last_dispatch_success
+        updated = 0
+        for update_callback, context in list(self._listeners.values()):
+            if notify_all or context is None or context in self._changed_task_ids:
+                update_callback()
+                updated += 1
+
+        self.instrumentation.record_timing("dispatch", time.perf_counter() - start)
+        self.instrumentation.record_size("dispatched_listeners", updated)
+
+        self._changed_task_ids = set()
+        self._last_dispatch_success = self.last_update_success
+
+    def _update_project_summaries(self, now) -> None:
+        """Recompute the summary of every project from the task index."""
+        project_tasks = self.data[DATA_PROJECT_TASKS_KEY]
+        self.project_summaries = {
+            project_id: summarize_project_tasks(project_tasks.get(project_id, {}).values(), now)
+            for project_id in self.data[DATA_PROJECTS_KEY]
+        }
+
+    def _interval_bounds(self) -> tuple[int, int]:
+        """Return the (min, max) adaptive polling interval in seconds."""
+        min_interval = self.config_entry.data.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+        max_interval = self.config_entry.data.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL)
+        return min_interval, max(min_interval, max_interval)
+
+    def _adapt_update_interval(self, changed: bool) -> None:
+        """Poll at the minimum interval after a change, otherwise back off exponentially up to the maximum.
+
+        Without adaptive polling the configured fixed interval is used. With push updates polling
+        only reconciles missed webhooks, so it runs at the slow reconciliation interval.
+        """
+        min_interval, max_interval = self._interval_bounds()
+        if self.config_entry.data.get(CONF_PUSH_UPDATES, False):
+            seconds = max(self.config_entry.data.get(CONF_SECS_INTERVAL) or 60, PUSH_RECONCILE_INTERVAL.total_seconds())
+        elif not self.config_entry.data.get(CONF_ADAPTIVE_POLLING, False):
+            seconds = self.config_entry.data.get(CONF_SECS_INTERVAL) or 60
+        elif changed or self.update_interval is None:
+            seconds = min_interval
+        else:
+            seconds = min(max(self.update_interval.total_seconds() * 2, min_interval), max_interval)
+
+        if self.update_interval != timedelta(seconds=seconds):
+            LOGGER.debug(f"Adaptive polling interval is now {seconds} seconds")
+            self.update_interval = timedelta(seconds=seconds)
+
+    @callback
+    def _async_handle_local_write(self) -> None:
+        """Pull the next sync in to the minimum interval after a write through Home Assistant."""
+        if not self.config_entry.data.get(CONF_ADAPTIVE_POLLING, False) or self.config_entry.data.get(CONF_PUSH_UPDATES, False):
+            return
+
+        min_interval, _ = self._interval_bounds()
+        if self.update_interval == timedelta(seconds=min_interval):
+            return
+
+        self.update_interval = timedelta(seconds=min_interval)
+        if self._listeners:
+            self._schedule_refresh()
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the data of the last successful sync from disk, returns whether there was any."""
+        snapshot = await self._store.async_load()
+        restored = deserialize_data(self._vikunja_api, snapshot) if snapshot else None
+        if restored is None:
+            return False
+
+        projects, tasks = restored
+        self.data = {
+            DATA_PROJECTS_KEY: projects,
+            DATA_TASKS_KEY: tasks,
+            DATA_PROJECT_TASKS_KEY: self._index_tasks_by_project(tasks),
+        }
+        self._due_scheduler.async_set_tasks({task_id: task.due_date for task_id, task in tasks.items()})
+        self.derived_fields.update(tasks.values())
+        if self.config_entry.data.get(CONF_PROJECT_SUMMARY, False):
+            self._update_project_summaries(dt_util.now())
+
+        self.restored_from_snapshot = True
+        LOGGER.info(f"Restored {len(projects)} projects and {len(tasks)} tasks from the last sync")
+        return True
+
+    @callback
+    def _async_save_snapshot(self) -> None:
+        """Write the current data to disk once writes have settled."""
+        self._store.async_delay_save(
+            lambda: serialize_data(self._vikunja_api.web_ui_link, self.data), SNAPSHOT_SAVE_DELAY
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel the due date timer and pending writes along with any scheduled refresh."""
+        await super().async_shutdown()
+        self._due_scheduler.async_shutdown()
+        self._write_debouncer.async_shutdown()
+
+    async def async_apply_task(self, task: TaskSnapshot) -> None:
+        """Apply the snapshot of a task returned by an API write or pushed by a webhook, and only update that task's listeners.
+
+        This replaces a full refresh after a write, the next scheduled sync reconciles anything missed.
+        """
+        skip_done = self.config_entry.data.get(CONF_HIDE_DONE) or False
+        if (task.done and skip_done) or task.project_id not in self.data[DATA_PROJECTS_KEY]:
+            await self.async_remove_tasks({task.id})
+            return
+
+        tasks = self.data[DATA_TASKS_KEY]
+        project_tasks = self.data[DATA_PROJECT_TASKS_KEY]
+
+        previous = tasks.get(task.id)
+        if previous is None:
+            if self.config_entry.data.get(CONF_TASKS_AS_DEVICES, True):
+                self._pending_task_ids.add(task.id)
+        elif previous.project_id != task.project_id:
+            project_tasks.get(previous.project_id, {}).pop(task.id, None)
+
+        tasks[task.id] = task
+        project_tasks.setdefault(task.project_id, {})[task.id] = task
+        self._shards.mark_dirty(task.project_id)
+        self._due_scheduler.async_set_task(task.id, task.due_date)
+        self.derived_fields.update([task])
+
+        self._async_save_snapshot()
+        self._async_queue_write({task.id})
+
+    @property
+    def api_calls(self) -> int:
+        """Number of HTTP requests sent to the Vikunja API by this coordinator, 304 responses included."""
+        return self.request_cache.requests + self._task_fetches
+
+    async def async_fetch_task(self, task_id: int) -> Task:
+        """Fetch the full task to write to, the data only holds a snapshot of each task.
+
+        Writes then also start from the task as it is now on the server, not as of the last sync.
+        """
+        self._task_fetches += 1
+        return await self._vikunja_api.get_task(task_id)
+
+    async def async_remove_tasks(self, task_ids: set[int]) -> None:
+        """Remove deleted tasks from the data and registries, without a refresh."""
+        for task_id in task_ids:
+            task = self.data[DATA_TASKS_KEY].pop(task_id, None)
+            if task is not None:
+                self.data[DATA_PROJECT_TASKS_KEY].get(task.project_id, {}).pop(task_id, None)
+                self._shards.mark_dirty(task.project_id)
+        self._due_scheduler.async_set_tasks({task_id: None for task_id in task_ids})
+        self.derived_fields.forget(task_ids)
+
+        await remove_tasks_and_projects(self._hass, self._config_id, task_ids=task_ids)
+        self._has_task_devices = None
+
+        self._async_save_snapshot()
+        self._async_queue_write(set())
+
+    @callback
+    def async_request_write_refresh(self) -> None:
+        """Request a refresh after a write that couldn't be applied locally, shared by the writes of a batch."""
+        self.write_refresh_requests += 1
+        self._write_refresh_requested = True
+        self._write_debouncer.async_schedule_call()
+
+    @callback
+    def _async_queue_write(self, task_ids: set[int]) -> None:
+        """Queue the listener update of a write, to dispatch it along with the other writes of the batch."""
+        self.writes += 1
+        self._written_task_ids |= task_ids
+        self._write_debouncer.async_schedule_call()
+
+    async def _async_flush_writes(self) -> None:
+        """Dispatch the writes of a batch at once, then run the refresh they requested."""
+        task_ids, self._written_task_ids = self._written_task_ids, set()
+        refresh, self._write_refresh_requested = self._write_refresh_requested, False
+
+        self.write_dispatches += 1
+        self._async_handle_local_write()
+        self._async_update_changed_listeners(task_ids)
+
+        if refresh:
+            self.write_refreshes += 1
+            await self.async_request_refresh()
+
+    @callback
+    def _async_update_changed_listeners(self, task_ids: set[int]) -> None:
+        """Mark tasks as changed outside a sync and dispatch to their listeners."""
+        if self._changed_task_ids is not None:
+            self._changed_task_ids |= task_ids
+
+        self.async_update_listeners()
+
     def _is_project_selected(self, project_id: int) -> bool:
         """Check if a project is selected for synchronization."""
         selected_projects = self.config_entry.data.get(CONF_SELECTED_PROJECTS, [CONF_ALL_PROJECTS])
@@ -45,81 +397,398 @@ class VikunjaDataUpdateCoordinator(DataUpdateCoordinator):
         # Check if this specific project is in the selected list
         return str(project_id) in selected_projects
 
+    @property
+    def max_concurrent_requests(self) -> int:
+        """Maximum number of Vikunja API requests to have in flight at once."""
+        return self.config_entry.data.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS)
+
+    def _use_bulk_sync(self, all_projects: list[Project], projects: list[Project]) -> bool:
+        """Check if the global task listing is cheaper than fetching each selected project."""
+        selected_projects = self.config_entry.data.get(CONF_SELECTED_PROJECTS, [CONF_ALL_PROJECTS])
+
+        if CONF_ALL_PROJECTS in selected_projects:
+            return True
+
+        if not all_projects:
+            return False
+
+        return len(projects) / len(all_projects) >= BULK_SYNC_MIN_SELECTED_RATIO
+
+    async def _fetch_task_listing(
+            self, params: dict | None = None, received: list[TaskSnapshot] | None = None
+    ) -> list[TaskSnapshot]:
+        """Fetch tasks through the global task listing, following every page.
+
+        The first page reports the total page count, the remaining pages are then
+        fetched concurrently. The tasks of each page are also added to `received` as
+        soon as it arrives, so they are kept if the sync is cancelled.
+        """
+
+        async def fetch_page(page: int) -> tuple[list[TaskSnapshot], int]:
+            page_params = {**(params or {}), "page": page, "per_page": BULK_SYNC_PAGE_SIZE}
+            # Filtered listings change every sync, only the full listing is worth caching
+            response = await self.request_cache.async_get_page(
+                "/tasks/all", page_params, self.request_cache.parse_task, cache=not params
+            )
+            if received is not None:
+                received.extend(response[0])
+            return response
+
+        first_tasks, total_pages = await fetch_page(1)
+
+        tasks = list(first_tasks)
+        for page, response in await gather_with_limit(
+                list(range(2, total_pages + 1)), fetch_page, self.max_concurrent_requests
+        ):
+            if isinstance(response, Exception):
+                raise response
+            tasks.extend(response[0])
+
+        return tasks
+
+    @staticmethod
+    def _partition_by_project(tasks: Iterable[TaskSnapshot], projects: list[Project]) -> dict[int, list[TaskSnapshot]]:
+        """Group tasks by project, dropping tasks of projects that aren't in `projects`."""
+        project_tasks: dict[int, list[TaskSnapshot]] = {project.id: [] for project in projects}
+        for task in tasks:
+            if task.project_id in project_tasks:
+                project_tasks[task.project_id].append(task)
+
+        return project_tasks
+
+    async def _fetch_all_tasks(
+            self, projects: list[Project], received: list[TaskSnapshot] | None = None
+    ) -> dict[int, list[TaskSnapshot]]:
+        """Fetch every visible task in one listing and partition it by project."""
+        LOGGER.info("Fetching all tasks from Vikunja API...")
+        tasks = await self._fetch_task_listing(received=received)
+        return self._partition_by_project(tasks, projects)
+
+    async def _fetch_changed_tasks(
+            self, projects: list[Project], received: list[TaskSnapshot] | None = None
+    ) -> dict[int, list[TaskSnapshot]]:
+        """Fetch only tasks updated since the last sync and merge them into the known tasks.
+
+        Deleted tasks aren't reported by Vikunja, those are picked up by the next full sync.
+        """
+        since = self._updated_high_water.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        LOGGER.info(f"Fetching tasks updated since {since} from Vikunja API...")
+        changed_tasks = await self._fetch_task_listing({"filter": f"updated >= {since}"}, received)
+        LOGGER.info(f"Fetched {len(changed_tasks)} changed tasks.")
+
+        tasks = dict(self.data[DATA_TASKS_KEY])
+        for task in changed_tasks:
+            tasks[task.id] = task
+
+        return self._partition_by_project(tasks.values(), projects)
+
+    def _needs_full_sync(self, projects: list[Project]) -> bool:
+        """Check if this sync has to download every task rather than only the changed ones."""
+        if not self.config_entry.data.get(CONF_INCREMENTAL_SYNC, False):
+            return True
+
+        if self.data is None or self._updated_high_water is None or self._last_full_sync is None:
+            return True
+
+        # Tasks of newly selected projects can be older than the high-water mark
+        if {project.id for project in projects} != set(self.data[DATA_PROJECTS_KEY].keys()):
+            return True
+
+        if self.failed_projects or self.stale_projects:
+            return True
+
+        return dt_util.utcnow() - self._last_full_sync >= INCREMENTAL_FULL_SYNC_INTERVAL
+
+    async def _fetch_project_tasks(self, projects: list[Project], budget: float) -> dict[int, list[TaskSnapshot] | Exception]:
+        """Fetch the tasks of every project concurrently, bounded by the configured limit.
+
+        Results are keyed by project ID in the same order as `projects`, with the
+        exception in place of the task list for any project that failed. Projects still
+        being fetched when the budget runs out get a `SyncBudgetExceeded`, and projects that
+        ran out of budget on the last sync are fetched first.
+        """
+        limit = self.max_concurrent_requests
+        results: dict[int, list[TaskSnapshot] | Exception] = {}
+
+        async def fetch(project: Project) -> list[TaskSnapshot]:
+            LOGGER.info(f"Fetching tasks from Vikunja API for project {project.id}...")
+            try:
+                results[project.id] = await self.request_cache.async_get_tasks(project.id)
+            except Exception as e:
+                results[project.id] = e
+                raise
+            return results[project.id]
+
+        ordered = sorted(projects, key=lambda project: project.id not in self.stale_projects)
+        try:
+            async with async_timeout.timeout(budget):
+                await gather_with_limit(ordered, fetch, limit)
+        except asyncio.TimeoutError:
+            LOGGER.warning(f"Sync budget ran out with {len(projects) - len(results)} projects left to fetch")
+
+        return {
+            project.id: results.get(project.id, SyncBudgetExceeded("Sync budget exceeded"))
+            for project in projects
+        }
+
+    async def _fetch_with_budget(self, fetch_tasks, projects: list[Project], budget: float) -> dict[int, list[TaskSnapshot] | Exception]:
+        """Run a task listing sync within the budget.
+
+        If the budget runs out, every project gets a `SyncBudgetExceeded` holding its tasks
+        from the listing pages that did arrive, since a listing page isn't limited to one project.
+        """
+        received: list[TaskSnapshot] = []
+        try:
+            async with async_timeout.timeout(budget):
+                return await fetch_tasks(projects, received)
+        except asyncio.TimeoutError:
+            LOGGER.warning(
+                f"Sync budget ran out during the task listing after {len(received)} tasks, "
+                "fetching projects one by one next time"
+            )
+            received_tasks = self._partition_by_project(received, projects)
+            return {
+                project.id: SyncBudgetExceeded("Sync budget exceeded", received_tasks[project.id])
+                for project in projects
+            }
+
+    def _select_shard(self, projects: list[Project]) -> set[int] | None:
+        """Return the projects a sharded sync refreshes, None when every project is synced."""
+        if not self.config_entry.data.get(CONF_SHARDED_SYNC, False) or self.data is None:
+            return None
+
+        project_ids = [project.id for project in projects]
+        shard = self._shards.select(
+            project_ids,
+            self.update_interval.total_seconds(),
+            self.config_entry.data.get(CONF_SYNC_WINDOW, DEFAULT_SYNC_WINDOW),
+            asyncio.get_running_loop().time(),
+        )
+        # Projects the budget ran out on last time are retried straight away
+        return shard | (self.stale_projects & set(project_ids))
+
+    def _previous_tasks_for_project(self, project_id: int) -> list[TaskSnapshot]:
+        """Return the tasks from the last successful sync that belong to a project."""
+        if not self.data:
+            return []
+
+        return list(self.data[DATA_PROJECT_TASKS_KEY].get(project_id, {}).values())
+
+    @staticmethod
+    def _index_tasks_by_project(tasks: dict[int, TaskSnapshot]) -> dict[int, dict[int, TaskSnapshot]]:
+        """Index tasks by project ID, keeping the task order within each project."""
+        project_tasks: dict[int, dict[int, TaskSnapshot]] = {}
+        for task_id, task in tasks.items():
+            project_tasks.setdefault(task.project_id, {})[task_id] = task
+
+        return project_tasks
+
     async def _async_update_data(self):
         """Fetch data from Vikunja API."""
+        self.sync_count += 1
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config_entry.data.get(CONF_SYNC_TIMEOUT, DEFAULT_SYNC_TIMEOUT)
+        start = time.perf_counter()
+        bytes_received = self.request_cache.bytes_received
         try:
-            async with async_timeout.timeout(10):
-                LOGGER.info("Fetching projects from Vikunja API...")
-                all_projects = await self._vikunja_api.get_projects()
-                LOGGER.info(f"Fetched {len(all_projects)} total projects from API.")
-
-                # Filter projects based on user selection
-                projects = [p for p in all_projects if self._is_project_selected(p.id)]
-                LOGGER.info(f"Syncing {len(projects)} selected projects.")
-
-                # Get current projects and tasks, defaulting to empty sets
-                has_data = self.data is not None
-
-                skip_done = self.config_entry.data.get(CONF_HIDE_DONE) or False
-
-                current_projects = set(self.data[DATA_PROJECTS_KEY].keys()) if self.data else set()
-                current_tasks = set(self.data[DATA_TASKS_KEY].keys()) if self.data else set()
-
-                result = {DATA_PROJECTS_KEY: {}, DATA_TASKS_KEY: {}}
-                tasks = {}
-
-                for project in projects:
-                    result[DATA_PROJECTS_KEY][project.id] = project
-                    LOGGER.info(f"Fetching tasks from Vikunja API for project {project.id}...")
-                    new_tasks = await self._vikunja_api.get_tasks(project.id)
-
-                    for task in new_tasks:
-                        if task.done and skip_done:
-                            continue
-
-                        if task.id not in tasks.keys():
-                            tasks[task.id] = task
-
-                LOGGER.info(f"Fetched {len(tasks)} tasks from selected projects.")
-                result[DATA_TASKS_KEY] = tasks
-
-                # Calculate new and removed items
-                new_tasks = set(result[DATA_TASKS_KEY].keys()) - current_tasks
-                removed_tasks = current_tasks - set(tasks)
-                new_projects = set(result[DATA_PROJECTS_KEY].keys()) - current_projects
-                removed_projects = current_projects - set(result[DATA_PROJECTS_KEY].keys())
-
-                # Detect changes to the tasks as devices setting, and populate the new/removed
-                # tasksaccordingly to update the device and entity registries
-                should_have_task_devices = self.config_entry.data.get(CONF_TASKS_AS_DEVICES, True)
-                has_task_devices = has_task_devices_entries(self.hass, self.config_entry.entry_id)
-                if should_have_task_devices and not has_task_devices:
-                    new_tasks = set(result[DATA_TASKS_KEY].keys())
-                elif not should_have_task_devices and has_task_devices:
-                    removed_tasks = set(result[DATA_TASKS_KEY].keys())
-
-                # Reload only if new tasks or projects exist
-                if has_data and (new_tasks or new_projects):
-                    LOGGER.info("New tasks or projects detected, reloading entry")
-                    self._hass.config_entries.async_schedule_reload(self._config_id)
-
-                # Remove deleted tasks (including tasks from deselected projects)
-                if removed_tasks:
-                    for task_id in removed_tasks:
-                        LOGGER.info(f"Attempting to remove task {task_id}")
-                        await remove_task_with_entities(self._hass, self._config_id, task_id)
-
-                # Remove entities for deselected/deleted projects
-                if removed_projects:
-                    LOGGER.info(f"Projects removed from sync: {removed_projects}")
-                    for project_id in removed_projects:
-                        LOGGER.info(f"Attempting to remove project entities for project {project_id}")
-                        await remove_project_entities(self._hass, self._config_id, project_id)
-
-                return result
+            LOGGER.info("Fetching projects from Vikunja API...")
+            with self.instrumentation.measure("get_projects"):
+                all_projects = await self.request_cache.async_get_projects()
+            LOGGER.info(f"Fetched {len(all_projects)} total projects from API.")
+
+            # Filter projects based on user selection
+            projects = [p for p in all_projects if self._is_project_selected(p.id)]
+            LOGGER.info(f"Syncing {len(projects)} selected projects.")
+
+            # Get current projects and tasks, defaulting to empty sets
+            has_data = self.data is not None
+
+            skip_done = self.config_entry.data.get(CONF_HIDE_DONE) or False
+
+            current_projects = set(self.data[DATA_PROJECTS_KEY].keys()) if self.data else set()
+            current_tasks = set(self.data[DATA_TASKS_KEY].keys()) if self.data else set()
+
+            result = {DATA_PROJECTS_KEY: {}, DATA_TASKS_KEY: {}, DATA_PROJECT_TASKS_KEY: {}}
+            tasks = {}
+
+            fetch_start = time.perf_counter()
+            project_tasks = None
+            # A sharded sync always fetches its projects one by one
+            shard = self._select_shard(projects)
+            full_sync = shard is None and self._needs_full_sync(projects)
+            # Once the budget ran out, projects are fetched one by one, the out of budget ones
+            # first, until every project is synced again. Another listing would run out as well
+            use_listing = shard is None and not self.stale_projects
+            if use_listing and not full_sync:
+                try:
+                    project_tasks = await self._fetch_with_budget(
+                        self._fetch_changed_tasks, projects, deadline - loop.time()
+                    )
+                except (APIError, httpx.HTTPError) as e:
+                    LOGGER.warning(f"Incremental task sync failed, falling back to a full sync: {e}")
+                    full_sync = True
+
+            if project_tasks is None and use_listing and self._use_bulk_sync(all_projects, projects):
+                try:
+                    project_tasks = await self._fetch_with_budget(
+                        self._fetch_all_tasks, projects, deadline - loop.time()
+                    )
+                except (APIError, httpx.HTTPError) as e:
+                    LOGGER.warning(f"Bulk task sync failed, falling back to per-project sync: {e}")
+
+            if project_tasks is None:
+                shard_projects = projects if shard is None else [p for p in projects if p.id in shard]
+                project_tasks = await self._fetch_project_tasks(shard_projects, deadline - loop.time())
+            self.instrumentation.record_timing("fetch_tasks", time.perf_counter() - fetch_start)
+
+            process_start = time.perf_counter()
+            stale_projects = {
+                project_id for project_id, error in project_tasks.items() if isinstance(error, SyncBudgetExceeded)
+            }
+            failed_projects = {
+                project_id: str(error)
+                for project_id, error in project_tasks.items()
+                if isinstance(error, Exception) and project_id not in stale_projects
+            }
+            self.failed_projects = failed_projects
+            self.stale_projects = stale_projects
+            # Out of budget projects keep their last known tasks and the tasks of the listing pages
+            # that did arrive, which needs either data from an earlier sync or at least one page
+            received_tasks = any(project_tasks[project_id].tasks for project_id in stale_projects)
+            if project_tasks and len(failed_projects) + len(stale_projects) == len(project_tasks) and (
+                    failed_projects or not (has_data or received_tasks)
+            ):
+                raise UpdateFailed(f"Failed to fetch tasks for all {len(project_tasks)} projects")
+
+            for project in projects:
+                result[DATA_PROJECTS_KEY][project.id] = project
+                new_tasks = project_tasks.get(project.id)
+
+                if new_tasks is None:
+                    # Not part of this shard
+                    new_tasks = self._previous_tasks_for_project(project.id)
+                elif project.id in failed_projects:
+                    # Keep the last known tasks so a transient failure doesn't remove entities
+                    LOGGER.warning(f"Failed to fetch tasks for project {project.id}: {failed_projects[project.id]}")
+                    new_tasks = self._previous_tasks_for_project(project.id)
+                elif project.id in stale_projects:
+                    LOGGER.warning(f"Tasks of project {project.id} ran out of sync budget, keeping the last known tasks")
+                    new_tasks = list({
+                        task.id: task
+                        for task in [*self._previous_tasks_for_project(project.id), *new_tasks.tasks]
+                    }.values())
+
+                for task in new_tasks:
+                    if task.done and skip_done:
+                        continue
+
+                    if task.id not in tasks.keys():
+                        tasks[task.id] = task
+
+            LOGGER.info(f"Fetched {len(tasks)} tasks from selected projects.")
+            result[DATA_TASKS_KEY] = tasks
+            result[DATA_PROJECT_TASKS_KEY] = self._index_tasks_by_project(tasks)
+
+            previous_tasks = self.data[DATA_TASKS_KEY] if self.data else {}
+            self._changed_task_ids = {
+                task_id for task_id, task in tasks.items()
+                if task_id not in previous_tasks or previous_tasks[task_id] != task
+            }
+            LOGGER.debug(f"{len(self._changed_task_ids)} tasks changed since the last sync.")
+
+            changed_projects = {tasks[task_id].project_id for task_id in self._changed_task_ids} | {
+                previous_tasks[task_id].project_id for task_id in previous_tasks.keys() - tasks.keys()
+            }
+            self._shards.record(
+                {
+                    project_id: project_id in changed_projects
+                    for project_id in project_tasks
+                    if project_id not in failed_projects and project_id not in stale_projects
+                },
+                loop.time(),
+            )
+
+            self._due_scheduler.async_set_tasks({
+                **{task_id: None for task_id in previous_tasks.keys() - tasks.keys()},
+                **{task_id: tasks[task_id].due_date for task_id in self._changed_task_ids},
+            })
+
+            # Derive the values entities show once here, rather than on every state read
+            with self.instrumentation.measure("derive"):
+                self.derived_fields.forget(previous_tasks.keys() - tasks.keys())
+                self.derived_fields.update(tasks[task_id] for task_id in self._changed_task_ids)
+
+            if full_sync:
+                self._last_full_sync = dt_util.utcnow()
+            self._updated_high_water = max(
+                (
+                    task.updated
+                    for fetched_tasks in project_tasks.values() if not isinstance(fetched_tasks, Exception)
+                    for task in fetched_tasks if task.updated
+                ),
+                default=self._updated_high_water,
+            )
+
+            # Calculate new and removed items
+            new_tasks = set(result[DATA_TASKS_KEY].keys()) - current_tasks
+            removed_tasks = current_tasks - set(tasks)
+            new_projects = set(result[DATA_PROJECTS_KEY].keys()) - current_projects
+            removed_projects = current_projects - set(result[DATA_PROJECTS_KEY].keys())
+
+            # Detect changes to the tasks as devices setting, and populate the new/removed
+            # tasksaccordingly to update the device and entity registries
+            should_have_task_devices = self.config_entry.data.get(CONF_TASKS_AS_DEVICES, True)
+            if self._has_task_devices is None:
+                self._has_task_devices = has_task_devices_entries(self.hass, self.config_entry.entry_id)
+            has_task_devices = self._has_task_devices
+            if should_have_task_devices and not has_task_devices:
+                new_tasks = set(result[DATA_TASKS_KEY].keys())
+            elif not should_have_task_devices and has_task_devices:
+                removed_tasks = set(result[DATA_TASKS_KEY].keys())
+
+            # Queue entities for new tasks and projects, they are added once the new data is published
+            if has_data and (new_tasks or new_projects):
+                LOGGER.info("New tasks or projects detected, adding their entities")
+                if should_have_task_devices:
+                    self._pending_task_ids |= new_tasks
+                self._pending_project_ids |= new_projects
+
+            self.instrumentation.record_timing("process", time.perf_counter() - process_start)
+            self.instrumentation.record_size("sync_tasks", len(tasks))
+
+            # Remove entities of deleted tasks (including tasks from deselected projects)
+            # and of deselected/deleted projects in one registry pass
+            for project_id in removed_projects:
+                self.request_cache.forget_project(project_id)
+            self._shards.forget(removed_projects)
+
+            if removed_tasks or removed_projects:
+                LOGGER.info(f"Removing {len(removed_tasks)} tasks and projects {removed_projects} from sync")
+                with self.instrumentation.measure("registry_cleanup"):
+                    await remove_tasks_and_projects(
+                        self._hass, self._config_id, task_ids=removed_tasks, project_ids=removed_projects
+                    )
+                self._has_task_devices = None
+
+            self._adapt_update_interval(
+                bool(self._changed_task_ids or removed_tasks or new_projects or removed_projects)
+            )
+
+            # Saved after the delay, once the coordinator holds the new result
+            self._async_save_snapshot()
+
+            return result
+        except UpdateFailed:
+            raise
         except APIError as e:
+            if e.status_code in (401, 403):
+                # Starts a reauth flow asking for a new token
+                raise ConfigEntryAuthFailed(f"Vikunja rejected the API token: {e}") from e
             LOGGER.debug(f"API Error fetching data from Vikunja: {e}")
             raise UpdateFailed(f"API Error: {e}") from e
         except Exception as e:
             LOGGER.debug(f"Unexpected error fetching data from Vikunja API: {e}")
             raise UpdateFailed(f"Unexpected error: {e}") from e
+        finally:
+            self.instrumentation.record_timing("sync", time.perf_counter() - start)
+            self.instrumentation.record_size("sync_bytes", self.request_cache.bytes_received - bytes_received)
@@ -2,8 +2,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from pyvikunja.api import VikunjaAPI
 
-from custom_components.vikunja.const import CONF_TASKS_AS_DEVICES
 from custom_components.vikunja.sensors.TaskSensors import *
+from custom_components.vikunja.sensors.vikunja_entity import async_setup_task_entities
 
 
 def get_datetime_sensors_for_task(coordinator, base_url, task_id):
@@ -25,18 +25,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     vikunja_api: VikunjaAPI = vikunja_data["api"]
     coordinator = vikunja_data["coordinator"]
 
-    # Create sensor entities
-    entities = []
-
-    tasks = coordinator.data[DATA_TASKS_KEY].keys()
-
-    if entry.data.get(CONF_TASKS_AS_DEVICES, True):
-        for task_id in tasks:
-            LOGGER.info(f"Task is {task_id}")
-            entities.extend(get_datetime_sensors_for_task(coordinator, vikunja_api.web_ui_link, task_id))
+    entities = async_setup_task_entities(
+        coordinator, entry, async_add_entities,
+        lambda task_id: get_datetime_sensors_for_task(coordinator, vikunja_api.web_ui_link, task_id),
+    )
 
     if not entities:
         LOGGER.warning("No entities created")
 
-    async_add_entities(entities, True)
-    LOGGER.info(f"Added {len(entities)} Vikunja datetime sensors.")
\ No newline at end of file
+    # The first refresh already loaded the data, so no update before add
+    async_add_entities(entities)
+    LOGGER.info(f"Added {len(entities)} Vikunja datetime sensors.")
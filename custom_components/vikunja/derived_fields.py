@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+from custom_components.vikunja.repeat import RepeatUnit, get_repeat_info_for_task
+from custom_components.vikunja.task_snapshot import TaskSnapshot
+
+# Longest state Home Assistant accepts
+MAX_STATE_LENGTH = 255
+
+
+@dataclass(frozen=True, slots=True)
+class DerivedTaskFields:
+    """Values task entities show that take more than reading a field, computed once per task version."""
+
+    updated: Optional[datetime]
+    repeat_unit: Optional[RepeatUnit]
+    repeat_value: Optional[int]
+    labels_text: str
+    labels_attributes: dict[str, Any]
+    assignees_text: str
+
+
+def derive_task_fields(task: TaskSnapshot) -> DerivedTaskFields:
+    """Compute the derived values of a task."""
+    repeat_unit, repeat_value = get_repeat_info_for_task(task)
+
+    if task.labels:
+        labels_text = ", ".join(sorted(label.title for label in task.labels))[:MAX_STATE_LENGTH]
+    else:
+        labels_text = "No labels"
+
+    if task.assignees:
+        # Prefer the display name over the username
+        assignees_text = ", ".join(
+            user.name or user.username or "Unknown" for user in task.assignees
+        )[:MAX_STATE_LENGTH]
+    else:
+        assignees_text = "Unassigned"
+
+    return DerivedTaskFields(
+        updated=task.updated,
+        repeat_unit=repeat_unit,
+        repeat_value=repeat_value,
+        labels_text=labels_text,
+        labels_attributes={
+            "labels": [
+                {"id": label.id, "title": label.title, "color": label.hex_color}
+                for label in sorted(task.labels, key=lambda label: label.id)
+            ]
+        },
+        assignees_text=assignees_text,
+    )
+
+
+class DerivedFieldCache:
+    """Derived values of every task, keyed by task ID and recomputed when the task's `updated` time changes."""
+
+    def __init__(self):
+        self._fields: dict[int, DerivedTaskFields] = {}
+        self.computed = 0
+
+    def get(self, task: TaskSnapshot) -> DerivedTaskFields:
+        """Return the derived values of a task, computing them if the task changed since."""
+        fields = self._fields.get(task.id)
+        # Without an `updated` time there is no telling whether the task changed
+        if fields is None or task.updated is None or fields.updated != task.updated:
+            fields = self._fields[task.id] = derive_task_fields(task)
+            self.computed += 1
+        return fields
+
+    def update(self, tasks: Iterable[TaskSnapshot]) -> None:
+        """Recompute the derived values of tasks known to have changed.
+
+        Not every change bumps a task's `updated` time (labels are changed through their own
+        endpoint), so these are recomputed whatever it says.
+        """
+        for task in tasks:
+            self._fields[task.id] = derive_task_fields(task)
+            self.computed += 1
+
+    def forget(self, task_ids: Iterable[int]) -> None:
+        """Drop the values of removed tasks."""
+        for task_id in task_ids:
+            self._fields.pop(task_id, None)
+
+    def __len__(self) -> int:
+        return len(self._fields)
@@ -0,0 +1,51 @@
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DOMAIN,
+    CONF_TOKEN,
+    CONF_WEBHOOK_ID,
+    CONF_WEBHOOK_SECRET,
+    DATA_PROJECTS_KEY,
+    DATA_TASKS_KEY,
+)
+from .coordinator import VikunjaDataUpdateCoordinator
+
+TO_REDACT = {CONF_TOKEN, CONF_WEBHOOK_ID, CONF_WEBHOOK_SECRET}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a Vikunja config entry."""
+    coordinator: VikunjaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    data = coordinator.data or {}
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "sync": {
+            "sync_count": coordinator.sync_count,
+            "api_calls": coordinator.api_calls,
+            "update_interval": coordinator.update_interval.total_seconds() if coordinator.update_interval else None,
+            "last_update_success": coordinator.last_update_success,
+            "restored_from_snapshot": coordinator.restored_from_snapshot,
+            "failed_projects": coordinator.failed_projects,
+            "stale_projects": sorted(coordinator.stale_projects),
+            "projects": len(data.get(DATA_PROJECTS_KEY, {})),
+            "tasks": len(data.get(DATA_TASKS_KEY, {})),
+        },
+        "request_cache": coordinator.request_cache.stats,
+        "writes": {
+            "writes": coordinator.writes,
+            "dispatches": coordinator.write_dispatches,
+            "refresh_requests": coordinator.write_refresh_requests,
+            "refreshes": coordinator.write_refreshes,
+            "refreshes_saved": coordinator.write_refresh_requests - coordinator.write_refreshes,
+        },
+        "derived_fields": {
+            "tasks": len(coordinator.derived_fields),
+            "computed": coordinator.derived_fields.computed,
+        },
+        "instrumentation": coordinator.instrumentation.as_dict(),
+    }
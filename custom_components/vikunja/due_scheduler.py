@@ -0,0 +1,104 @@
+import heapq
+from datetime import datetime
+from typing import Callable, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from custom_components.vikunja.const import LOGGER
+
+
+class DueDateScheduler:
+    """Notify when task due dates pass, using a single timer armed for the next one.
+
+    Upcoming due dates are kept in a min-heap. Entries for tasks that changed or were
+    removed stay in the heap and are skipped when popped, as `_due_dates` holds the
+    current due date of every scheduled task.
+    """
+
+    def __init__(self, hass: HomeAssistant, on_due: Callable[[set[int]], None]):
+        self._hass = hass
+        self._on_due = on_due
+        self._heap: list[tuple[datetime, int]] = []
+        self._due_dates: dict[int, datetime] = {}
+        self._unsub_timer: Optional[CALLBACK_TYPE] = None
+        self._armed_for: Optional[datetime] = None
+
+    @callback
+    def async_set_task(self, task_id: int, due_date: Optional[datetime]) -> None:
+        """Schedule a task's due date, replacing any previous one."""
+        self._set(task_id, due_date)
+        self._async_arm()
+
+    @callback
+    def async_set_tasks(self, due_dates: dict[int, Optional[datetime]]) -> None:
+        """Schedule the due dates of several tasks and arm the timer once."""
+        for task_id, due_date in due_dates.items():
+            self._set(task_id, due_date)
+        self._async_arm()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the timer."""
+        if self._unsub_timer:
+            self._unsub_timer()
+        self._unsub_timer = None
+        self._armed_for = None
+
+    def _set(self, task_id: int, due_date: Optional[datetime]) -> None:
+        # Only future due dates are scheduled, past ones are already overdue
+        if due_date is None or due_date <= dt_util.now():
+            self._due_dates.pop(task_id, None)
+            return
+
+        if self._due_dates.get(task_id) == due_date:
+            return
+
+        self._due_dates[task_id] = due_date
+        heapq.heappush(self._heap, (due_date, task_id))
+
+        # Drop stale entries once they outnumber the scheduled tasks
+        if len(self._heap) > 2 * len(self._due_dates) + 64:
+            self._heap = [(due, task) for task, due in self._due_dates.items()]
+            heapq.heapify(self._heap)
+
+    def _discard_stale(self) -> None:
+        while self._heap and self._due_dates.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the timer for the earliest scheduled due date."""
+        self._discard_stale()
+        next_due = self._heap[0][0] if self._heap else None
+
+        if next_due == self._armed_for:
+            return
+
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        self._armed_for = next_due
+        if next_due is not None:
+            self._unsub_timer = async_track_point_in_time(self._hass, self._async_handle_due, next_due)
+
+    @callback
+    def _async_handle_due(self, now: datetime) -> None:
+        """Notify the tasks whose due date has passed and re-arm for the next one."""
+        self._unsub_timer = None
+        self._armed_for = None
+
+        due_task_ids = set()
+        while self._heap and self._heap[0][0] <= now:
+            due_date, task_id = heapq.heappop(self._heap)
+            if self._due_dates.get(task_id) == due_date:
+                del self._due_dates[task_id]
+                due_task_ids.add(task_id)
+
+        self._async_arm()
+
+        if due_task_ids:
+            LOGGER.debug(f"Due date passed for tasks {due_task_ids}")
+            self._on_due(due_task_ids)
@@ -0,0 +1,99 @@
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator
+
+# Number of most recent samples the percentiles are computed over
+SAMPLE_WINDOW = 200
+
+
+class RollingStats:
+    """Call count, total and the most recent samples of one measurement."""
+
+    __slots__ = ("count", "total", "last", "_samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.last: float | None = None
+        self._samples: deque[float] = deque(maxlen=SAMPLE_WINDOW)
+
+    def record(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.last = value
+        self._samples.append(value)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the nearest-rank percentile of the recent samples, None before the first one."""
+        return _percentile(sorted(self._samples), percent)
+
+    def as_dict(self, digits: int = 0) -> dict:
+        samples = sorted(self._samples)
+
+        def rounded(value: float | None) -> float | None:
+            return round(value, digits) if value is not None else None
+
+        return {
+            "count": self.count,
+            "last": rounded(self.last),
+            "mean": rounded(self.total / self.count if self.count else None),
+            "p50": rounded(_percentile(samples, 50)),
+            "p95": rounded(_percentile(samples, 95)),
+            "p99": rounded(_percentile(samples, 99)),
+            "max": rounded(samples[-1] if samples else None),
+        }
+
+
+def _percentile(samples: list[float], percent: float) -> float | None:
+    if not samples:
+        return None
+
+    return samples[max(0, math.ceil(percent / 100 * len(samples)) - 1)]
+
+
+class Instrumentation:
+    """Durations of the phases of a sync and dispatch, and the sizes of what they handled.
+
+    Durations are recorded in milliseconds. Only plain counters and bounded sample
+    windows are kept, so the cost stays constant however long Home Assistant runs.
+    """
+
+    def __init__(self):
+        self.timings: dict[str, RollingStats] = {}
+        self.sizes: dict[str, RollingStats] = {}
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Time the wrapped block as one call of `phase`, also when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_timing(phase, time.perf_counter() - start)
+
+    def record_timing(self, phase: str, seconds: float) -> None:
+        stats = self.timings.get(phase)
+        if stats is None:
+            stats = self.timings[phase] = RollingStats()
+        stats.record(seconds * 1000)
+
+    def record_size(self, name: str, size: int) -> None:
+        stats = self.sizes.get(name)
+        if stats is None:
+            stats = self.sizes[name] = RollingStats()
+        stats.record(size)
+
+    def timing(self, phase: str) -> RollingStats | None:
+        return self.timings.get(phase)
+
+    def size(self, name: str) -> RollingStats | None:
+        return self.sizes.get(name)
+
+    def as_dict(self) -> dict:
+        """Return every measurement, for diagnostics."""
+        return {
+            "timings_ms": {phase: stats.as_dict(digits=2) for phase, stats in sorted(self.timings.items())},
+            "sizes": {name: stats.as_dict() for name, stats in sorted(self.sizes.items())},
+        }
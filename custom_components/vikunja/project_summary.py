@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import Iterable, Optional
+
+from homeassistant.util import dt as dt_util
+from pyvikunja.models.enum.task_priority import Priority
+
+from custom_components.vikunja.task_snapshot import TaskSnapshot
+
+
+def get_priority_string(priority) -> str:
+    """Return the display name of a task priority."""
+    match priority:
+        case None:
+            return "None"
+        case Priority.LOW:
+            return "Low"
+        case Priority.MEDIUM:
+            return "Medium"
+        case Priority.HIGH:
+            return "High"
+        case Priority.URGENT:
+            return "Urgent"
+        case Priority.DO_IT_NOW:
+            return "DO IT NOW"
+        case _:
+            return "Unknown"
+
+
+PRIORITY_NAMES = [get_priority_string(None)] + [get_priority_string(priority) for priority in Priority]
+
+
+class ProjectSummary:
+    """Open task counts and upcoming work of one project."""
+
+    def __init__(self):
+        self.open = 0
+        self.overdue = 0
+        self.due_today = 0
+        self.next_due: Optional[TaskSnapshot] = None
+        self.priorities: dict[str, int] = {name: 0 for name in PRIORITY_NAMES}
+
+
+def summarize_project_tasks(tasks: Iterable[TaskSnapshot], now: datetime) -> ProjectSummary:
+    """Build the summary of a project in a single pass over its tasks.
+
+    pyvikunja parses dates into the host's local time, which can differ from the Home Assistant
+    time zone, so due dates and `now` are both converted to the latter before "today" is taken.
+    """
+    summary = ProjectSummary()
+    now = dt_util.as_local(now)
+    today = now.date()
+
+    for task in tasks:
+        if task.done:
+            continue
+
+        summary.open += 1
+        priority = get_priority_string(task.priority)
+        summary.priorities[priority] = summary.priorities.get(priority, 0) + 1
+
+        if not task.due_date:
+            continue
+
+        due_date = dt_util.as_local(task.due_date)
+        if due_date <= now:
+            summary.overdue += 1
+        elif summary.next_due is None or due_date < summary.next_due.due_date:
+            summary.next_due = task
+
+        if due_date.date() == today:
+            summary.due_today += 1
+
+    return summary
@@ -0,0 +1,48 @@
+from enum import Enum
+from typing import Optional
+
+from custom_components.vikunja.task_snapshot import TaskSnapshot
+
+
+def get_repeat_info_for_task(task: TaskSnapshot) -> tuple[Optional['RepeatUnit'], Optional[int]]:
+    """Returns the repeat unit and repeat interval from a task snapshot."""
+    if task.repeat_after is None or task.repeat_after.total_seconds() <= 0:
+        return None, None
+
+    unit = RepeatUnit.from_seconds(int(task.repeat_after.total_seconds()))
+    scaled_value = int(int(task.repeat_after.total_seconds()) / unit.seconds)
+
+    return unit, scaled_value
+
+
+class RepeatUnit(Enum):
+    HOURS = (3600, "Hours")  # 1 Hour = 3600 seconds
+    DAYS = (86400, "Days")  # 1 Day = 86400 seconds
+    WEEKS = (604800, "Weeks")  # 1 Week = 604800 seconds
+
+    def __init__(self, seconds: int, display: str):
+        self.seconds = seconds
+        self.display = display
+
+    @classmethod
+    def list_display_values(cls) -> list[str]:
+        """Returns a list of display names for the UI dropdown."""
+        return [unit.display for unit in cls]
+
+    @classmethod
+    def from_seconds(cls, seconds: int) -> 'RepeatUnit':
+        """Determine the best unit and return the unit"""
+        if seconds % RepeatUnit.WEEKS.seconds == 0:
+            return RepeatUnit.WEEKS
+        elif seconds % RepeatUnit.DAYS.seconds == 0:
+            return RepeatUnit.DAYS
+        else:
+            return RepeatUnit.HOURS
+
+    @classmethod
+    def from_display(cls, display: str) -> 'RepeatUnit':
+        """Get the RepeatUnit from its display string."""
+        for unit in cls:
+            if unit.display.lower() == display.lower():
+                return unit
+        raise ValueError(f"Invalid repeat unit: {display}")
@@ -0,0 +1,185 @@
+import hashlib
+from typing import Any, Callable, Optional
+
+import httpx
+from pyvikunja.api import VikunjaAPI, APIError
+from pyvikunja.models.project import Project
+from custom_components.vikunja.const import LOGGER, REQUEST_TIMEOUT
+from custom_components.vikunja.task_snapshot import TaskSnapshot
+
+# Page size pyvikunja uses for its paginated listings
+DEFAULT_PAGE_SIZE = 20
+
+
+class CachedPage:
+    """A listing page as last received, with the objects parsed from it."""
+
+    __slots__ = ("params", "etag", "last_modified", "content_hash", "total_pages", "items")
+
+    def __init__(self, params: dict, etag: Optional[str], last_modified: Optional[str], content_hash: str,
+                 total_pages: int, items: list):
+        self.params = params
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+        self.total_pages = total_pages
+        self.items = items
+
+
+class ConditionalRequestCache:
+    """Fetch Vikunja listings page by page, reusing the parsed objects of unchanged pages.
+
+    Pages are revalidated with the ETag or Last-Modified the server sent, so an unchanged page
+    can come back as a bodyless 304. Servers without validators still send the page, which is
+    then compared by content hash and only parsed when it changed.
+    """
+
+    def __init__(self, vikunja_api: VikunjaAPI):
+        self._vikunja_api = vikunja_api
+        self._pages: dict[tuple[str, int], CachedPage] = {}
+        self._page_counts: dict[str, int] = {}
+
+        # HTTP requests sent, whether the page then turned out unchanged or not
+        self.requests = 0
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        # Pages fetched with the cache off, left out of the hits and misses
+        self.uncached = 0
+        # Body bytes of every listing page received, bodyless 304 responses add nothing
+        self.bytes_received = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit and miss counts of the cache, for diagnostics."""
+        return {
+            "requests": self.requests,
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncached": self.uncached,
+            "not_modified": self.not_modified,
+            "cached_pages": len(self._pages),
+            "bytes_received": self.bytes_received,
+        }
+
+    async def async_get_projects(self) -> list[Project]:
+        """Return all projects, like `VikunjaAPI.get_projects`."""
+        return await self.async_get_listing("/projects", self.parse_project)
+
+    async def async_get_tasks(self, project_id: int) -> list[TaskSnapshot]:
+        """Return snapshots of the tasks of a project, like `VikunjaAPI.get_tasks`."""
+        return await self.async_get_listing(f"/projects/{project_id}/tasks", self.parse_task)
+
+    async def async_get_listing(self, endpoint: str, parse: Callable[[dict], Any]) -> list:
+        """Return every page of a listing, one request per page."""
+        items = []
+        page = 1
+        while True:
+            page_items, total_pages = await self.async_get_page(
+                endpoint, {"page": page, "per_page": DEFAULT_PAGE_SIZE}, parse
+            )
+            items.extend(page_items)
+            if page >= total_pages:
+                return items
+            page += 1
+
+    async def async_get_page(
+            self, endpoint: str, params: dict, parse: Callable[[dict], Any], cache: bool = True
+    ) -> tuple[list, int]:
+        """Return the parsed items of a listing page and the total page count of the listing.
+
+        Pages fetched with `cache` off, like filtered listings that change on every sync, are
+        neither revalidated nor kept.
+        """
+        if not cache:
+            response = await self._async_get(endpoint, params, dict(self._vikunja_api.headers))
+            self.bytes_received += len(response.content)
+            self.uncached += 1
+            return (
+                [parse(item) for item in response.json() or []],
+                int(response.headers.get("x-pagination-total-pages", 1)),
+            )
+
+        key = (endpoint, params.get("page", 1))
+        cached = self._pages.get(key)
+        if cached is not None and cached.params != params:
+            # Same page of a listing with other filters, the cached copy can't be reused
+            cached = None
+
+        headers = dict(self._vikunja_api.headers)
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = await self._async_get(endpoint, params, headers)
+        self.bytes_received += len(response.content)
+
+        if response.status_code == 304 and cached is not None:
+            self.not_modified += 1
+            self.hits += 1
+            return cached.items, cached.total_pages
+
+        content_hash = hashlib.sha1(response.content).hexdigest()
+        total_pages = int(response.headers.get("x-pagination-total-pages", 1))
+
+        if cached is not None and cached.content_hash == content_hash:
+            self.hits += 1
+            cached.total_pages = total_pages
+            return cached.items, total_pages
+
+        self.misses += 1
+        items = [parse(item) for item in response.json() or []]
+        self._pages[key] = CachedPage(
+            params,
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+            content_hash,
+            total_pages,
+            items,
+        )
+
+        if key[1] == 1 and total_pages < self._page_counts.get(endpoint, 0):
+            # The listing shrank, drop the pages after its new last one
+            self._drop_pages(endpoint, after=total_pages)
+        self._page_counts[endpoint] = total_pages
+
+        return items, total_pages
+
+    def forget_project(self, project_id: int) -> None:
+        """Drop the cached task pages of a project that is no longer synced."""
+        endpoint = f"/projects/{project_id}/tasks"
+        self._drop_pages(endpoint, after=0)
+        self._page_counts.pop(endpoint, None)
+
+    def _drop_pages(self, endpoint: str, after: int) -> None:
+        for page in range(after + 1, self._page_counts.get(endpoint, 0) + 1):
+            self._pages.pop((endpoint, page), None)
+
+    async def _async_get(self, endpoint: str, params: dict, headers: dict) -> httpx.Response:
+        url = f"{self._vikunja_api.api_base_url}{endpoint}"
+        self.requests += 1
+        try:
+            response = await self._vikunja_api.client.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            LOGGER.debug(f"HTTP error occurred: {e.response.status_code} | {e.response.text} | URL: {url}")
+            raise APIError(e.response.status_code, f"HTTP error: {e.response.text}") from e
+        except httpx.TimeoutException as e:
+            LOGGER.debug(f"Request timed out: {e} | URL: {url}")
+            # Not a TimeoutError, which the coordinator would take for its sync budget running out
+            raise APIError(0, f"Request to {endpoint} timed out") from e
+        except httpx.RequestError as e:
+            LOGGER.debug(f"Request error occurred: {e} | URL: {url}")
+            raise APIError(0, f"Request error: {e}") from e
+
+    def parse_project(self, data: dict) -> Project:
+        """Build a project of the cached API from listing data."""
+        return Project(self._vikunja_api, data)
+
+    def parse_task(self, data: dict) -> TaskSnapshot:
+        """Build a task snapshot from listing data."""
+        return TaskSnapshot.from_data(data)
@@ -2,8 +2,11 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from pyvikunja.api import VikunjaAPI
 
-from custom_components.vikunja.const import CONF_TASKS_AS_DEVICES, LOGGER
+from custom_components.vikunja.const import CONF_PROJECT_SUMMARY, LOGGER
 from custom_components.vikunja.sensors.TaskSensors import *
+from custom_components.vikunja.sensors.project.project_summary_sensors import *
+from custom_components.vikunja.sensors.diagnostic_sensors import *
+from custom_components.vikunja.sensors.vikunja_entity import async_setup_task_entities, async_setup_project_entities
 
 
 def get_sensors_for_task(coordinator, base_url, task_id):
@@ -18,6 +21,31 @@ def get_sensors_for_task(coordinator, base_url, task_id):
     ]
 
 
+def get_sensors_for_project(coordinator, base_url, project_id):
+    ## Project ID -1 is favourites, which has no summary of its own
+    if project_id == -1:
+        return []
+
+    return [
+        VikunjaProjectOpenTasksSensor(coordinator, base_url, project_id),
+        VikunjaProjectOverdueTasksSensor(coordinator, base_url, project_id),
+        VikunjaProjectDueTodayTasksSensor(coordinator, base_url, project_id),
+        VikunjaProjectNextDueSensor(coordinator, base_url, project_id),
+        VikunjaProjectPrioritySensor(coordinator, base_url, project_id),
+    ]
+
+
+def get_diagnostic_sensors(coordinator, base_url, entry_id):
+    return [
+        VikunjaPhaseDurationSensor(coordinator, base_url, entry_id, "sync", "Sync"),
+        VikunjaPhaseDurationSensor(coordinator, base_url, entry_id, "fetch_tasks", "Task Fetch"),
+        VikunjaPhaseDurationSensor(coordinator, base_url, entry_id, "dispatch", "Dispatch"),
+        VikunjaPhaseDurationSensor(coordinator, base_url, entry_id, "state_write", "State Write"),
+        VikunjaSyncPayloadSensor(coordinator, base_url, entry_id),
+        VikunjaApiCallsSensor(coordinator, base_url, entry_id),
+    ]
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     LOGGER.info("Setting up Vikunja sensors...")
 
@@ -30,19 +58,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     vikunja_api: VikunjaAPI = vikunja_data["api"]
     coordinator = vikunja_data["coordinator"]
 
-    # Create sensor entities
-    entities = []
+    entities = async_setup_task_entities(
+        coordinator, entry, async_add_entities,
+        lambda task_id: get_sensors_for_task(coordinator, vikunja_api.web_ui_link, task_id),
+    )
 
-    tasks = coordinator.data[DATA_TASKS_KEY].keys()
-
-    if entry.data.get(CONF_TASKS_AS_DEVICES, True):
-        tasks = coordinator.data[DATA_TASKS_KEY].keys()
-        for task_id in tasks:
-            LOGGER.info(f"Task is {task_id}")
-            entities.extend(get_sensors_for_task(coordinator, vikunja_api.web_ui_link, task_id))
+    # One device per project with a fixed set of summary entities, independent of the task count
+    if entry.data.get(CONF_PROJECT_SUMMARY, False):
+        entities.extend(async_setup_project_entities(
+            coordinator, async_add_entities,
+            lambda project_id: get_sensors_for_project(coordinator, vikunja_api.web_ui_link, project_id),
+        ))
 
     if not entities:
         LOGGER.warning("No entities created")
 
-    async_add_entities(entities, True)
+    # Sync timings and sizes, disabled by default
+    entities.extend(get_diagnostic_sensors(coordinator, vikunja_api.web_ui_link, entry.entry_id))
+
+    # The first refresh already loaded the data, so no update before add
+    async_add_entities(entities)
     LOGGER.info(f"Added {len(entities)} Vikunja sensors.")
@@ -5,8 +5,8 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.components.datetime import DateTimeEntity
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.util import dt
-from pyvikunja.models.enum.task_priority import Priority
 
+from custom_components.vikunja.project_summary import get_priority_string
 from custom_components.vikunja.sensors.vikunja_task_entity import *
 
 
@@ -206,21 +206,7 @@ class VikunjaTaskPrioritySensor(VikunjaTaskEntity, SensorEntity):
         return self.id_prefix() + "_priority"
 
     def _get_priority_string(self, priority):
-        match priority:
-            case None:
-                return "None"
-            case Priority.LOW:
-                return "Low"
-            case Priority.MEDIUM:
-                return "Medium"
-            case Priority.HIGH:
-                return "High"
-            case Priority.URGENT:
-                return "Urgent"
-            case Priority.DO_IT_NOW:
-                return "DO IT NOW"
-            case _:
-                return "Unknown"
+        return get_priority_string(priority)
 
 
 class VikunjaTaskStartDateSensor(VikunjaTaskEntity, DateTimeEntity):
@@ -250,8 +236,9 @@ class VikunjaTaskStartDateSensor(VikunjaTaskEntity, DateTimeEntity):
 
     async def async_set_value(self, value):
         LOGGER.info(f"Setting {self.name} to {value}")
-        await self.task.set_start_date(value)
-        await self.update_task()
+        task = await self.fetch_task()
+        await task.set_start_date(value)
+        await self.update_task(task)
 
     @property
     def unique_id(self) -> str:
@@ -285,8 +272,9 @@ class VikunjaTaskEndDateSensor(VikunjaTaskEntity, DateTimeEntity):
 
     async def async_set_value(self, value):
         LOGGER.info(f"Setting {self.name} to {value}")
-        await self.task.set_end_date(value)
-        await self.update_task()
+        task = await self.fetch_task()
+        await task.set_end_date(value)
+        await self.update_task(task)
 
     @property
     def unique_id(self) -> str:
@@ -302,9 +290,10 @@ class VikunjaTaskCompleteButton(VikunjaTaskEntity, ButtonEntity):
     async def async_press(self):
         """Handle button press."""
         LOGGER.info(f"Marking task {self.task.title} as done...")
-        await self.task.mark_as_done()  # Mark task as done via API
+        task = await self.fetch_task()
+        await task.mark_as_done()  # Mark task as done via API
 
-        await self.update_task()
+        await self.update_task(task)
 
     @property
     def name(self):
@@ -329,13 +318,7 @@ class VikunjaTaskAssigneeSensor(VikunjaTaskEntity, SensorEntity):
     @property
     def state(self):
         """Return the state of the sensor."""
-        if self.task.assignees:
-            return (", ".join(self._get_assignee_display_name(assignee) for assignee in self.task.assignees))[:255]
-        return "Unassigned"
-    
-    def _get_assignee_display_name(self, assignee):
-        """Get the display name for an assignee, preferring name over username."""
-        return assignee.name or assignee.username or "Unknown"
+        return self.derived.assignees_text
 
     @property
     def icon(self):
@@ -360,25 +343,12 @@ class VikunjaTaskLabelsSensor(VikunjaTaskEntity, SensorEntity):
     @property
     def state(self):
         """Return a comma-separated list of label titles (max 255 chars)."""
-        if self.task.labels:
-            titles = sorted(label.title for label in self.task.labels)
-            return (", ".join(titles))[:255]
-        return "No labels"
+        return self.derived.labels_text
 
     @property
     def extra_state_attributes(self):
         """Expose full label detail for use in automations and templates."""
-        labels = sorted(self.task.labels, key=lambda label: label.id)
-        return {
-            "labels": [
-                {
-                    "id": label.id,
-                    "title": label.title,
-                    "color": label.hex_color,
-                }
-                for label in labels
-            ]
-        }
+        return self.derived.labels_attributes
 
     @property
     def icon(self):
@@ -0,0 +1,146 @@
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from custom_components.vikunja import DOMAIN
+from custom_components.vikunja.instrumentation import RollingStats
+
+
+class VikunjaDiagnosticEntity(CoordinatorEntity):
+    """Base class for the sync diagnostic entities of a config entry, disabled until enabled in the UI."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator, base_url, entry_id):
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._coordinator = coordinator
+        self._base_url = base_url
+        self._entry_id = entry_id
+
+    def id_prefix(self):
+        return f"{self._entry_id}_diagnostics"
+
+    @property
+    def device_info(self):
+        """Return the device information."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.id_prefix())},
+            name="Vikunja",
+            manufacturer="Vikunja",
+            model="Server",
+            entry_type=DeviceEntryType.SERVICE,
+            configuration_url=self._base_url,
+        )
+
+
+class VikunjaPhaseDurationSensor(VikunjaDiagnosticEntity, SensorEntity):
+    """Duration of the last call of a sync or dispatch phase, with percentiles of the recent calls."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, coordinator, base_url, entry_id, phase: str, label: str):
+        super().__init__(coordinator, base_url, entry_id)
+        self._phase = phase
+        self._label = label
+
+    @property
+    def stats(self) -> RollingStats | None:
+        return self._coordinator.instrumentation.timing(self._phase)
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"Vikunja {self._label} Duration"
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self.stats.last if self.stats else None
+
+    @property
+    def extra_state_attributes(self):
+        if not self.stats:
+            return None
+
+        stats = self.stats.as_dict(digits=2)
+        return {key: stats[key] for key in ("count", "p50", "p95", "p99")}
+
+    @property
+    def icon(self):
+        """Icon for the sensor."""
+        return "mdi:timer-outline"
+
+    @property
+    def unique_id(self) -> str:
+        return self.id_prefix() + f"_{self._phase}_duration"
+
+
+class VikunjaSyncPayloadSensor(VikunjaDiagnosticEntity, SensorEntity):
+    """Bytes of listing pages received by the last sync."""
+
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+
+    @property
+    def stats(self) -> RollingStats | None:
+        return self._coordinator.instrumentation.size("sync_bytes")
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return "Vikunja Sync Payload"
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self.stats.last if self.stats else None
+
+    @property
+    def extra_state_attributes(self):
+        if not self.stats:
+            return None
+
+        stats = self.stats.as_dict()
+        return {key: stats[key] for key in ("count", "p50", "p95", "p99")}
+
+    @property
+    def icon(self):
+        """Icon for the sensor."""
+        return "mdi:download-network-outline"
+
+    @property
+    def unique_id(self) -> str:
+        return self.id_prefix() + "_sync_payload"
+
+
+class VikunjaApiCallsSensor(VikunjaDiagnosticEntity, SensorEntity):
+    """Number of HTTP requests sent to Vikunja since the integration was loaded, including revalidations answered with 304."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "calls"
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return "Vikunja API Calls"
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self._coordinator.api_calls
+
+    @property
+    def icon(self):
+        """Icon for the sensor."""
+        return "mdi:api"
+
+    @property
+    def unique_id(self) -> str:
+        return self.id_prefix() + "_api_calls"
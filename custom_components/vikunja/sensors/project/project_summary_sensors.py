@@ -0,0 +1,161 @@
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+
+from custom_components.vikunja.project_summary import PRIORITY_NAMES
+from custom_components.vikunja.sensors.vikunja_project_entity import VikunjaProjectEntity
+
+
+class VikunjaProjectOpenTasksSensor(VikunjaProjectEntity, SensorEntity):
+    """Number of open tasks in a Vikunja project."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "tasks"
+
+    def __init__(self, coordinator, base_url, project_id):
+        super().__init__(coordinator, base_url, project_id)
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{self.name_prefix()} Open Tasks"
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self.summary.open
+
+    @property
+    def icon(self):
+        """Icon for the sensor."""
+        return "mdi:format-list-checks"
+
+    @property
+    def unique_id(self) -> str:
+        return self.id_prefix() + "_open_tasks"
+
+
+class VikunjaProjectOverdueTasksSensor(VikunjaProjectEntity, SensorEntity):
+    """Number of overdue open tasks in a Vikunja project."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "tasks"
+
+    def __init__(self, coordinator, base_url, project_id):
+        super().__init__(coordinator, base_url, project_id)
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{self.name_prefix()} Overdue Tasks"
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self.summary.overdue
+
+    @property
+    def icon(self):
+        """Icon for the sensor."""
+        return "mdi:calendar-alert"
+
+    @property
+    def unique_id(self) -> str:
+        return self.id_prefix() + "_overdue_tasks"
+
+
+class VikunjaProjectDueTodayTasksSensor(VikunjaProjectEntity, SensorEntity):
+    """Number of open tasks in a Vikunja project that are due today."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "tasks"
+
+    def __init__(self, coordinator, base_url, project_id):
+        super().__init__(coordinator, base_url, project_id)
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{self.name_prefix()} Tasks Due Today"
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self.summary.due_today
+
+    @property
+    def icon(self):
+        """Icon for the sensor."""
+        return "mdi:calendar-today"
+
+    @property
+    def unique_id(self) -> str:
+        return self.id_prefix() + "_due_today_tasks"
+
+
+class VikunjaProjectNextDueSensor(VikunjaProjectEntity, SensorEntity):
+    """Due date of the next open task in a Vikunja project, with the task as attributes."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, coordinator, base_url, project_id):
+        super().__init__(coordinator, base_url, project_id)
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{self.name_prefix()} Next Due Task"
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        next_due = self.summary.next_due
+        return next_due.due_date if next_due else None
+
+    @property
+    def extra_state_attributes(self):
+        """Expose the next due task for use in automations and templates."""
+        next_due = self.summary.next_due
+        return {
+            "task_id": next_due.id if next_due else None,
+            "title": next_due.title if next_due else None,
+        }
+
+    @property
+    def icon(self):
+        """Icon for the sensor."""
+        return "mdi:calendar-clock"
+
+    @property
+    def unique_id(self) -> str:
+        return self.id_prefix() + "_next_due"
+
+
+class VikunjaProjectPrioritySensor(VikunjaProjectEntity, SensorEntity):
+    """Highest priority among the open tasks of a Vikunja project, with a count per priority."""
+
+    def __init__(self, coordinator, base_url, project_id):
+        super().__init__(coordinator, base_url, project_id)
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{self.name_prefix()} Highest Priority"
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        priorities = self.summary.priorities
+        return next((name for name in reversed(PRIORITY_NAMES) if priorities[name]), None)
+
+    @property
+    def extra_state_attributes(self):
+        """Expose the number of open tasks per priority."""
+        return dict(self.summary.priorities)
+
+    @property
+    def icon(self):
+        """Icon for the sensor."""
+        return "mdi:flag"
+
+    @property
+    def unique_id(self) -> str:
+        return self.id_prefix() + "_priorities"
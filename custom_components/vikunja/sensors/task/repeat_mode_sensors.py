@@ -1,60 +1,13 @@
 from datetime import timedelta
-from enum import Enum
-from typing import Optional
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.components.select import SelectEntity
 from homeassistant.components.switch import SwitchEntity
 from pyvikunja.models.enum.repeat_mode import RepeatMode
-from pyvikunja.models.task import Task
 
 from custom_components.vikunja import LOGGER
 from custom_components.vikunja.sensors.vikunja_task_entity import VikunjaTaskEntity
-
-
-def get_repeat_info_for_task(task: Task) -> tuple[Optional['RepeatUnit'], Optional[int]]:
-    """Returns the repeat unit and repeat interval from a Task."""
-    if task.repeat_after is None or task.repeat_after.total_seconds() <= 0:
-        return None, None
-
-    unit = RepeatUnit.from_seconds(int(task.repeat_after.total_seconds()))
-    scaled_value = int(int(task.repeat_after.total_seconds()) / unit.seconds)
-
-    return unit, scaled_value
-
-
-class RepeatUnit(Enum):
-    HOURS = (3600, "Hours")  # 1 Hour = 3600 seconds
-    DAYS = (86400, "Days")  # 1 Day = 86400 seconds
-    WEEKS = (604800, "Weeks")  # 1 Week = 604800 seconds
-
-    def __init__(self, seconds: int, display: str):
-        self.seconds = seconds
-        self.display = display
-
-    @classmethod
-    def list_display_values(cls) -> list[str]:
-        """Returns a list of display names for the UI dropdown."""
-        return [unit.display for unit in cls]
-
-    @classmethod
-    def from_seconds(cls, seconds: int) -> 'RepeatUnit':
-        """Determine the best unit and return the unit"""
-        if seconds % RepeatUnit.WEEKS.seconds == 0:
-            return RepeatUnit.WEEKS
-        elif seconds % RepeatUnit.DAYS.seconds == 0:
-            return RepeatUnit.DAYS
-        else:
-            return RepeatUnit.HOURS
-
-    @classmethod
-    def from_display(cls, display: str) -> 'RepeatUnit':
-        """Get the RepeatUnit from its display string."""
-        for unit in cls:
-            if unit.display.lower() == display.lower():
-                return unit
-        raise ValueError(f"Invalid repeat unit: {display}")
-
+from custom_components.vikunja.repeat import RepeatUnit
 
 REPEAT_MODE_OPTIONS = {
     RepeatMode.DEFAULT: "Default",
@@ -74,13 +27,15 @@ class VikunjaRepeatModeEnabledSwitch(VikunjaTaskEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn on repeat mode."""
-        await self.task.set_repeating_enabled(True)  # Update task to enable repeat mode
-        await self.update_task()
+        task = await self.fetch_task()
+        await task.set_repeating_enabled(True)  # Update task to enable repeat mode
+        await self.update_task(task)
 
     async def async_turn_off(self, **kwargs):
         """Turn off repeat mode."""
-        await self.task.set_repeating_enabled(False)  # Update task to disable repeat mode
-        await self.update_task()
+        task = await self.fetch_task()
+        await task.set_repeating_enabled(False)  # Update task to disable repeat mode
+        await self.update_task(task)
 
     @property
     def name(self):
@@ -119,8 +74,9 @@ class VikunjaRepeatModeSelect(VikunjaTaskEntity, SelectEntity):
     async def async_select_option(self, option: str):
         """Handle user selection of a new repeat mode."""
         mode_value = next((k for k, v in REPEAT_MODE_OPTIONS.items() if v == option), None)
-        await self.task.set_repeating_interval(mode=RepeatMode(mode_value))
-        await self.update_task()
+        task = await self.fetch_task()
+        await task.set_repeating_interval(mode=RepeatMode(mode_value))
+        await self.update_task(task)
 
     @property
     def name(self):
@@ -145,7 +101,7 @@ class VikunjaRepeatIntervalSizeSensor(VikunjaTaskEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         # Get the tasks current repeat unit and value
-        current_unit, current_value = get_repeat_info_for_task(self.task)
+        current_unit, current_value = self.derived.repeat_unit, self.derived.repeat_value
 
         if current_unit is None or current_value is None:
             return None
@@ -155,8 +111,9 @@ class VikunjaRepeatIntervalSizeSensor(VikunjaTaskEntity, NumberEntity):
         new_value = value * current_unit.seconds
 
         # Send update
-        await self.task.set_repeating_interval(interval=timedelta(seconds=new_value))
-        await self.update_task()
+        task = await self.fetch_task()
+        await task.set_repeating_interval(interval=timedelta(seconds=new_value))
+        await self.update_task(task)
 
     @property
     def name(self):
@@ -166,8 +123,7 @@ class VikunjaRepeatIntervalSizeSensor(VikunjaTaskEntity, NumberEntity):
     @property
     def native_value(self) -> float:
         """Return the value of the sensor."""
-        unit, scaled_value = get_repeat_info_for_task(self.task)
-        return scaled_value
+        return self.derived.repeat_value
 
     @property
     def native_max_value(self) -> float:
@@ -180,7 +136,7 @@ class VikunjaRepeatIntervalSizeSensor(VikunjaTaskEntity, NumberEntity):
     @property
     def native_unit_of_measurement(self):
         """Return the unit of measurement of the sensor."""
-        unit, scaled_value = get_repeat_info_for_task(self.task)
+        unit, scaled_value = self.derived.repeat_unit, self.derived.repeat_value
 
         if unit is None or scaled_value is None:
             return None
@@ -230,7 +186,7 @@ class VikunjaRepeatIntervalUnitSensor(VikunjaTaskEntity, SelectEntity):
     @property
     def state(self):
         """Return the state of the sensor."""
-        unit, scaled_value = get_repeat_info_for_task(self.task)
+        unit = self.derived.repeat_unit
 
         if unit is None:
             return None
@@ -244,7 +200,7 @@ class VikunjaRepeatIntervalUnitSensor(VikunjaTaskEntity, SelectEntity):
         unit = RepeatUnit.from_display(option)
 
         # Get the tasks current repeat unit and value
-        current_unit, current_value = get_repeat_info_for_task(self.task)
+        current_unit, current_value = self.derived.repeat_unit, self.derived.repeat_value
 
         if current_unit is None or current_value is None:
             return None
@@ -254,8 +210,9 @@ class VikunjaRepeatIntervalUnitSensor(VikunjaTaskEntity, SelectEntity):
         new_value = current_value * unit.seconds
 
         # Send update
-        await self.task.set_repeating_interval(interval=timedelta(seconds=new_value))
-        await self.update_task()
+        task = await self.fetch_task()
+        await task.set_repeating_interval(interval=timedelta(seconds=new_value))
+        await self.update_task(task)
 
     @property
     def available(self) -> bool:
@@ -0,0 +1,60 @@
+from typing import Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from custom_components.vikunja.const import CONF_TASKS_AS_DEVICES, DATA_PROJECTS_KEY, DATA_TASKS_KEY
+
+
+class VikunjaCoordinatorEntity(CoordinatorEntity):
+    """Base class for all Vikunja entities that belong to a task or project."""
+
+    def _is_removed(self) -> bool:
+        """Check if the task or project of this entity is no longer in the coordinator data."""
+        return False
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # The task or project was removed, this entity is removed along with its registry entry
+        if self._is_removed():
+            return
+
+        with self.coordinator.instrumentation.measure("state_write"):
+            super()._handle_coordinator_update()
+
+
+@callback
+def async_setup_task_entities(
+        coordinator, entry: ConfigEntry, async_add_entities: AddEntitiesCallback,
+        entity_factory: Callable[[int], list[Entity]],
+) -> list[Entity]:
+    """Return the entities of every current task of a platform, when tasks are created as devices.
+
+    Entities for tasks created later are added by the coordinator without reloading the entry.
+    """
+    entities = []
+    if entry.data.get(CONF_TASKS_AS_DEVICES, True):
+        for task_id in coordinator.data[DATA_TASKS_KEY]:
+            entities.extend(entity_factory(task_id))
+
+    coordinator.async_add_task_platform(async_add_entities, entity_factory)
+    return entities
+
+
+@callback
+def async_setup_project_entities(
+        coordinator, async_add_entities: AddEntitiesCallback, entity_factory: Callable[[int], list[Entity]],
+) -> list[Entity]:
+    """Return the entities of every current project of a platform.
+
+    Entities for projects created later are added by the coordinator without reloading the entry.
+    """
+    entities = []
+    for project_id in coordinator.data[DATA_PROJECTS_KEY]:
+        entities.extend(entity_factory(project_id))
+
+    coordinator.async_add_project_platform(async_add_entities, entity_factory)
+    return entities
@@ -0,0 +1,45 @@
+from homeassistant.helpers.device_registry import DeviceInfo
+from pyvikunja.models.project import Project
+
+from custom_components.vikunja import DOMAIN
+from custom_components.vikunja.const import DATA_PROJECTS_KEY
+from custom_components.vikunja.sensors.vikunja_entity import VikunjaCoordinatorEntity
+
+
+class VikunjaProjectEntity(VikunjaCoordinatorEntity):
+    """Base class for all Vikunja Project entities."""
+
+    def __init__(self, coordinator, base_url, project_id):
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._coordinator = coordinator
+        self._project_id = project_id
+        self._base_url = base_url
+
+    def _is_removed(self) -> bool:
+        return self._project_id not in self._coordinator.data[DATA_PROJECTS_KEY]
+
+    @property
+    def project(self) -> Project:
+        return self._coordinator.data[DATA_PROJECTS_KEY][self._project_id]
+
+    @property
+    def summary(self):
+        return self._coordinator.project_summaries[self._project_id]
+
+    def name_prefix(self):
+        return f"{self.project.title}"
+
+    def id_prefix(self):
+        return f"project_{self._project_id}"
+
+    @property
+    def device_info(self):
+        """Return the device information."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.id_prefix())},
+            name=self.name_prefix(),
+            manufacturer="Vikunja",
+            model="Project",
+            configuration_url=self._base_url + f"/projects/{self._project_id}"
+        )
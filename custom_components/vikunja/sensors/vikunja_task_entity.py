@@ -1,26 +1,36 @@
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from pyvikunja.models.task import Task
 
 from custom_components.vikunja import DOMAIN, LOGGER
 from custom_components.vikunja.const import DATA_TASKS_KEY
+from custom_components.vikunja.sensors.vikunja_entity import VikunjaCoordinatorEntity
+from custom_components.vikunja.task_snapshot import TaskSnapshot
 
 
-class VikunjaTaskEntity(CoordinatorEntity):
+class VikunjaTaskEntity(VikunjaCoordinatorEntity):
     """Base class for all Vikunja Task entities."""
 
     def __init__(self, coordinator, base_url, task_id):
         """Initialize the entity."""
-        super().__init__(coordinator)
+        # The task ID as context means this entity is only updated when its task changed
+        super().__init__(coordinator, context=task_id)
         self._coordinator = coordinator
         self._task_id = task_id
         self._base_url = base_url
 
+    def _is_removed(self) -> bool:
+        return self._task_id not in self._coordinator.data[DATA_TASKS_KEY]
+
     @property
-    def task(self) -> Task:
+    def task(self) -> TaskSnapshot:
         return self._coordinator.data[DATA_TASKS_KEY][self._task_id]
 
+    @property
+    def derived(self):
+        """Repeat info, label and assignee text of the task, derived once per sync."""
+        return self._coordinator.derived_fields.get(self.task)
+
     def name_prefix(self):
         return f"{self.task.title}"
 
@@ -38,11 +48,10 @@ class VikunjaTaskEntity(CoordinatorEntity):
             configuration_url=self._base_url + f"/tasks/{self.task.id}"
         )
 
-    async def async_update(self):
-        """Request an update from the coordinator."""
-        await self._coordinator.async_request_refresh()
+    async def fetch_task(self) -> Task:
+        """Fetch the full task from Vikunja to write to."""
+        return await self._coordinator.async_fetch_task(self._task_id)
 
-    async def update_task(self):
-        await self.async_update()
-        """Update the coordinator's stored task data and trigger an update."""
-        self._coordinator.async_update_listeners()
+    async def update_task(self, task: Task):
+        """Apply the task returned by an API write to the coordinator, instead of a full refresh."""
+        await self._coordinator.async_apply_task(TaskSnapshot.from_task(task))
@@ -0,0 +1,65 @@
+import math
+from typing import Iterable
+
+from custom_components.vikunja.const import LOGGER
+
+# Weight of the latest sync in a project's change rate, older syncs fade out geometrically
+CHANGE_RATE_WEIGHT = 0.3
+
+
+class ShardScheduler:
+    """Pick the rotating subset of projects each sync refreshes.
+
+    Every project is refreshed at least once per window. Within that, projects with
+    local writes go first, then projects are ordered by how long ago they were synced,
+    scaled up by how often their tasks changed on recent syncs.
+    """
+
+    def __init__(self):
+        self._last_synced: dict[int, float] = {}
+        self._change_rates: dict[int, float] = {}
+        self._dirty: set[int] = set()
+
+    def mark_dirty(self, project_id: int) -> None:
+        """Refresh a project on the next sync, after a write through Home Assistant."""
+        self._dirty.add(project_id)
+
+    def select(self, project_ids: Iterable[int], interval: float, window: float, now: float) -> set[int]:
+        """Return the projects to refresh on a sync running every `interval` seconds."""
+        project_ids = list(project_ids)
+        shard_size = max(1, math.ceil(len(project_ids) * interval / window))
+
+        # Projects never synced or not synced for a whole window can't wait any longer
+        due = {
+            project_id for project_id in project_ids
+            if now - self._last_synced.get(project_id, -math.inf) >= window
+        }
+        dirty = self._dirty & set(project_ids)
+
+        def priority(project_id: int) -> float:
+            age = now - self._last_synced[project_id]
+            return age * (1 + self._change_rates.get(project_id, 0))
+
+        rest = sorted(set(project_ids) - due - dirty, key=priority, reverse=True)
+        shard = due | dirty | set(rest[:max(0, shard_size - len(due) - len(dirty))])
+
+        LOGGER.debug(
+            f"Syncing {len(shard)} of {len(project_ids)} projects, "
+            f"{len(due)} due and {len(dirty)} with local writes"
+        )
+        return shard
+
+    def record(self, synced: dict[int, bool], now: float) -> None:
+        """Record the projects a sync refreshed, mapped to whether their tasks changed."""
+        for project_id, changed in synced.items():
+            self._last_synced[project_id] = now
+            rate = self._change_rates.get(project_id, 0)
+            self._change_rates[project_id] = rate + CHANGE_RATE_WEIGHT * (float(changed) - rate)
+            self._dirty.discard(project_id)
+
+    def forget(self, project_ids: Iterable[int]) -> None:
+        """Drop projects that are no longer synced."""
+        for project_id in project_ids:
+            self._last_synced.pop(project_id, None)
+            self._change_rates.pop(project_id, None)
+            self._dirty.discard(project_id)
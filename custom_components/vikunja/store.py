@@ -0,0 +1,42 @@
+from typing import Any, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from pyvikunja.api import VikunjaAPI
+from pyvikunja.models.project import Project
+from custom_components.vikunja.const import DATA_PROJECTS_KEY, DATA_TASKS_KEY, DOMAIN
+from custom_components.vikunja.task_snapshot import TaskSnapshot
+
+STORAGE_VERSION = 1
+
+PROJECT_FIELDS = ("id", "title", "description", "is_archived", "hex_color")
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding the last synced data of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+def serialize_data(base_url: str, data: dict) -> dict[str, Any]:
+    """Serialize coordinator data into the compact form kept on disk."""
+    return {
+        "base_url": base_url,
+        "projects": [
+            {field: getattr(project, field) for field in PROJECT_FIELDS}
+            for project in data[DATA_PROJECTS_KEY].values()
+        ],
+        "tasks": [task.as_data() for task in data[DATA_TASKS_KEY].values()],
+    }
+
+
+def deserialize_data(vikunja_api: VikunjaAPI, snapshot: dict[str, Any]) -> Optional[tuple[dict, dict]]:
+    """Rebuild the projects and tasks of a snapshot, None if it was taken from another Vikunja instance.
+
+    Tasks stored by earlier versions hold the full Vikunja task data, which parses the same way.
+    """
+    if snapshot.get("base_url") != vikunja_api.web_ui_link:
+        return None
+
+    projects = {project["id"]: Project(vikunja_api, project) for project in snapshot["projects"]}
+    tasks = {task["id"]: TaskSnapshot.from_data(task) for task in snapshot["tasks"]}
+    return projects, tasks
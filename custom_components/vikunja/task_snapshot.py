@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from pyvikunja.models.enum.repeat_mode import RepeatMode
+from pyvikunja.models.enum.task_priority import Priority
+from pyvikunja.models.task import Task
+
+
+@dataclass(frozen=True, slots=True)
+class TaskLabel:
+    """A label as shown on a task."""
+
+    id: int
+    title: str
+    hex_color: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class TaskAssignee:
+    """A user a task is assigned to."""
+
+    id: int
+    name: str
+    username: str
+
+
+@dataclass(frozen=True, slots=True)
+class TaskSnapshot:
+    """The fields of a task the entities show, kept by the coordinator instead of the full task.
+
+    Snapshots hold no raw data or API reference, so thousands of them stay small. Writes
+    fetch the full task with `VikunjaDataUpdateCoordinator.async_fetch_task` first.
+    """
+
+    id: int
+    project_id: Optional[int]
+    title: str
+    description: str
+    done: bool
+    due_date: Optional[datetime]
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+    priority: Optional[Priority]
+    repeat_after: Optional[timedelta]
+    repeat_mode: Optional[RepeatMode]
+    labels: tuple[TaskLabel, ...]
+    assignees: tuple[TaskAssignee, ...]
+    updated: Optional[datetime]
+
+    @property
+    def repeat_enabled(self) -> bool:
+        return self.repeat_after is not None
+
+    @classmethod
+    def from_task(cls, task: Task) -> "TaskSnapshot":
+        """Snapshot a task returned by pyvikunja."""
+        return cls(
+            id=task.id,
+            project_id=task.project_id,
+            title=task.title,
+            description=task.description,
+            done=task.done,
+            due_date=task.due_date,
+            start_date=task.start_date,
+            end_date=task.end_date,
+            priority=task.priority,
+            repeat_after=task.repeat_after,
+            repeat_mode=task.repeat_mode,
+            labels=tuple(TaskLabel(label.id, label.title, label.hex_color) for label in task.labels),
+            assignees=tuple(TaskAssignee(user.id, user.name, user.username) for user in task.assignees),
+            updated=task.updated,
+        )
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> "TaskSnapshot":
+        """Snapshot task data as returned by the Vikunja API, or as written by `as_data`."""
+        return cls.from_task(Task(None, data))
+
+    def as_data(self) -> dict[str, Any]:
+        """Return the snapshot as Vikunja task data, for storage."""
+        return {
+            "id": self.id,
+            "project_id": self.project_id,
+            "title": self.title,
+            "description": self.description,
+            "done": self.done,
+            "due_date": _format_date(self.due_date),
+            "start_date": _format_date(self.start_date),
+            "end_date": _format_date(self.end_date),
+            "priority": self.priority.value if self.priority is not None else 0,
+            "repeat_after": int(self.repeat_after.total_seconds()) if self.repeat_after is not None else 0,
+            "repeat_mode": self.repeat_mode.value if self.repeat_mode is not None else None,
+            "labels": [
+                {"id": label.id, "title": label.title, "hex_color": label.hex_color} for label in self.labels
+            ],
+            "assignees": [
+                {"id": user.id, "name": user.name, "username": user.username} for user in self.assignees
+            ],
+            "updated": _format_date(self.updated),
+        }
+
+
+def _format_date(date: Optional[datetime]) -> Optional[str]:
+    return date.isoformat() if date is not None else None
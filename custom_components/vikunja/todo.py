@@ -5,14 +5,16 @@ import homeassistant.util.dt as dt
 from homeassistant.components.todo import TodoItem, TodoItemStatus, TodoListEntity, TodoListEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from pyvikunja.api import VikunjaAPI
 from pyvikunja.models.project import Project
-from pyvikunja.models.task import Task
 
 from custom_components.vikunja import VikunjaDataUpdateCoordinator, DOMAIN, LOGGER
-from custom_components.vikunja.const import DATA_PROJECTS_KEY, DATA_TASKS_KEY
+from custom_components.vikunja.const import DATA_PROJECTS_KEY, DATA_PROJECT_TASKS_KEY
+from custom_components.vikunja.sensors.vikunja_entity import VikunjaCoordinatorEntity, async_setup_project_entities
+from custom_components.vikunja.task_snapshot import TaskSnapshot
+from custom_components.vikunja.util import gather_with_limit
 
 
 async def async_setup_entry(
@@ -27,23 +29,23 @@ async def async_setup_entry(
     vikunja_api: VikunjaAPI = vikunja_data["api"]
     coordinator = vikunja_data["coordinator"]
 
-    ## Filter projects to all that aren't ID -1 (that's favourites)
-    projects: list[Project] = [proj for proj in coordinator.data[DATA_PROJECTS_KEY].values() if proj.id != -1]
-
-    async_add_entities(
-        (
-            VikunjaTaskTodoListEntity(
-                coordinator,
-                vikunja_api.web_ui_link,
-                project.id,
-            )
-            for project in projects
-        ),
-        True,
-    )
+    async_add_entities(async_setup_project_entities(
+        coordinator, async_add_entities,
+        lambda project_id: get_todo_lists_for_project(coordinator, vikunja_api.web_ui_link, project_id),
+    ))
+
+
+def get_todo_lists_for_project(coordinator, base_url, project_id):
+    ## Project ID -1 is favourites, which has no todo list of its own
+    if project_id == -1:
+        return []
 
+    return [
+        VikunjaTaskTodoListEntity(coordinator, base_url, project_id)
+    ]
 
-def _convert_api_item(item: Task) -> TodoItem:
+
+def _convert_api_item(item: TaskSnapshot) -> TodoItem:
     """Convert tasks API items into a TodoItem."""
     status = TodoItemStatus.COMPLETED if item.done else TodoItemStatus.NEEDS_ACTION
 
@@ -57,7 +59,7 @@ def _convert_api_item(item: Task) -> TodoItem:
 
 
 class VikunjaTaskTodoListEntity(
-    CoordinatorEntity, TodoListEntity
+    VikunjaCoordinatorEntity, TodoListEntity
 ):
     """A To-do List representation of the Shopping List."""
 
@@ -82,6 +84,9 @@ class VikunjaTaskTodoListEntity(
         self._coordinator = coordinator
         self._project_id = project_id
 
+    def _is_removed(self) -> bool:
+        return self._project_id not in self._coordinator.data[DATA_PROJECTS_KEY]
+
     @property
     def project(self) -> Project:
         return self._coordinator.data[DATA_PROJECTS_KEY][self._project_id]
@@ -94,15 +99,17 @@ class VikunjaTaskTodoListEntity(
     def unique_id(self) -> str | None:
         return f"todo_list_{self.project.id}"
 
-    def tasks_for_project(self) -> list[Task]:
+    def _project_tasks(self) -> dict[int, TaskSnapshot]:
+        """Return this project's entry in the coordinator's task index."""
+        return self._coordinator.data[DATA_PROJECT_TASKS_KEY].get(self._project_id, {})
+
+    def tasks_for_project(self) -> list[TaskSnapshot]:
         """Return tasks that belong to this project."""
-        return [task for task in self._coordinator.data[DATA_TASKS_KEY].values() if task.project_id == self._project_id]
+        return list(self._project_tasks().values())
 
-    def task_by_id(self, id: int) -> Optional[Task]:
+    def task_by_id(self, id: int) -> Optional[TaskSnapshot]:
         """Return a single task by its ID, or None if not found."""
-        tasks = self.tasks_for_project()
-
-        return next((task for task in tasks if task.id == id), None)
+        return self._project_tasks().get(id)
 
     @property
     def todo_items(self) -> list[TodoItem] | None:
@@ -123,26 +130,35 @@ class VikunjaTaskTodoListEntity(
         if item.due is not None and item.status != TodoItemStatus.COMPLETED:
             data["due_date"] = str(item.due.replace(tzinfo=dt.DEFAULT_TIME_ZONE).isoformat())
 
-        await self.project.create_task(data)
-        self._coordinator.async_update_listeners()
-        await self._coordinator.async_request_refresh()
+        task = await self.project.create_task(data)
+        await self._coordinator.async_apply_task(TaskSnapshot.from_task(task))
 
     async def async_delete_todo_items(self, uids: list[str]) -> None:
-        for uid in uids:
-            id = int(uid)
+        tasks = [task for task in (self.task_by_id(int(uid)) for uid in uids) if task is not None]
+
+        # Delete concurrently, a failed delete doesn't stop the others
+        vikunja_api = self.project.api
+        results = await gather_with_limit(
+            tasks, lambda task: vikunja_api.delete_task(task.id), self._coordinator.max_concurrent_requests
+        )
 
-            task = self.task_by_id(id)
+        deleted = {task.id for task, result in results if not isinstance(result, Exception)}
+        failed = {task.id: result for task, result in results if isinstance(result, Exception)}
 
-            await task.delete_task()
-            self._coordinator.async_update_listeners()
-            await self._coordinator.async_request_refresh()
+        await self._coordinator.async_remove_tasks(deleted)
+
+        if failed:
+            # Resync so the list shows what is actually left on the server
+            self._coordinator.async_request_write_refresh()
+            errors = ", ".join(f"{task_id}: {error}" for task_id, error in failed.items())
+            raise HomeAssistantError(f"Failed to delete {len(failed)} of {len(tasks)} tasks ({errors})")
 
     async def async_update_todo_item(self, item: TodoItem) -> None:
         """Update a To-do item."""
         uid = int(item.uid)
 
         # Find task that matches ID
-        task = self.task_by_id(uid)
+        known = self.task_by_id(uid) is not None
 
         new_data = {
             "done": item.status == TodoItemStatus.COMPLETED,
@@ -154,8 +170,10 @@ class VikunjaTaskTodoListEntity(
         if item.due is not None and item.status != TodoItemStatus.COMPLETED:
             new_data["due_date"] = str(item.due.replace(tzinfo=dt.DEFAULT_TIME_ZONE).isoformat())
 
-        if task is not None:
+        if known:
+            # Snapshots can't be written to, update the full task as it is now on the server
+            task = await self._coordinator.async_fetch_task(uid)
             await task.update(new_data)
-
-        self._coordinator.async_update_listeners()
-        await self._coordinator.async_request_refresh()
+            await self._coordinator.async_apply_task(TaskSnapshot.from_task(task))
+        else:
+            self._coordinator.async_request_write_refresh()
@@ -1,24 +1,90 @@
+import asyncio
+from typing import Awaitable, Callable, Iterable, TypeVar
+
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import device_registry as dr
 
 from custom_components.vikunja.const import LOGGER
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def gather_with_limit(
+        items: list[T], func: Callable[[T], Awaitable[R]], limit: int
+) -> list[tuple[T, R | Exception]]:
+    """Run func for every item with at most `limit` calls in flight.
+
+    Results are returned in the same order as `items`. A failing call returns its
+    exception in place of a result so the other calls are not discarded.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    results = await asyncio.gather(*(_run(item) for item in items), return_exceptions=True)
+    return list(zip(items, results))
+
+
+def registry_owner_key(unique_id: str) -> tuple[str, str] | None:
+    """Return the (kind, id) of the task or project a registry entry belongs to, based on its unique ID."""
+    # Task entities: task_{task_id}_{suffix}
+    if unique_id.startswith("task_"):
+        return "task", unique_id.split("_", 2)[1]
+
+    # Todo list entities: todo_list_{project_id}
+    if unique_id.startswith("todo_list_"):
+        return "project", unique_id[len("todo_list_"):]
+
+    # Project summary entities: project_{project_id}_{suffix}
+    if unique_id.startswith("project_"):
+        return "project", unique_id.split("_", 2)[1]
+
+    return None
+
+
+def build_registry_index(hass: HomeAssistant, config_id: str) -> dict[tuple[str, str], list[er.RegistryEntry]]:
+    """Group the config entry's registry entries by the task or project they belong to, in one pass."""
+    ent_reg = er.async_get(hass)
+
+    index: dict[tuple[str, str], list[er.RegistryEntry]] = {}
+    for entry in ent_reg.entities.get_entries_for_config_entry_id(config_id):
+        key = registry_owner_key(entry.unique_id)
+        if key is not None:
+            index.setdefault(key, []).append(entry)
+
+    return index
+
+
+async def remove_tasks_and_projects(
+        hass: HomeAssistant, config_id: str, task_ids: Iterable = (), project_ids: Iterable = ()
+) -> None:
+    """Remove all entities and devices linked to Vikunja tasks and projects within the correct config entry.
+
+    The registry is indexed once per call, so the cost doesn't grow with the number of removed items.
+    """
+    keys = [("task", str(task_id)) for task_id in task_ids] + [("project", str(project_id)) for project_id in project_ids]
+    if not keys:
+        return
 
-async def remove_task_with_entities(hass: HomeAssistant, config_id: str, task_id: str) -> None:
-    """Remove all entities linked to a Vikunja task within the correct config entry."""
     ent_reg = er.async_get(hass)
     dev_reg = dr.async_get(hass)
+    index = build_registry_index(hass, config_id)
 
     devices_to_check = set()
     entities_to_remove = []
 
-    for entry in ent_reg.entities.get_entries_for_config_entry_id(config_id):
-        if entry.unique_id.startswith(f"task_{task_id}_"):
+    for key in keys:
+        for entry in index.get(key, []):
             entities_to_remove.append(entry.entity_id)
             if entry.device_id:
                 devices_to_check.add(entry.device_id)
 
+    LOGGER.info(f"Removing {len(entities_to_remove)} entities and {len(devices_to_check)} devices")
+
     # Remove each entity
     for entity_id in entities_to_remove:
         ent_reg.async_remove(entity_id)
@@ -27,36 +93,31 @@ async def remove_task_with_entities(hass: HomeAssistant, config_id: str, task_id
         dev_reg.async_remove_device(device_id)
 
 
-async def remove_project_entities(hass: HomeAssistant, config_id: str, project_id: str) -> None:
-    """Remove all entities linked to a Vikunja project within the correct config entry."""
+async def remove_project_summary_entities(hass: HomeAssistant, config_id: str) -> None:
+    """Remove the project summary entities and devices of a config entry."""
     ent_reg = er.async_get(hass)
     dev_reg = dr.async_get(hass)
 
     devices_to_check = set()
     entities_to_remove = []
 
-    # Remove todo list entity for the project
     for entry in ent_reg.entities.get_entries_for_config_entry_id(config_id):
-        # Check for todo list entity (unique_id: todo_list_{project_id})
-        if entry.unique_id == f"todo_list_{project_id}":
-            LOGGER.info(f"Marking todo list entity for removal: {entry.entity_id}")
+        if entry.unique_id.startswith("project_"):
             entities_to_remove.append(entry.entity_id)
             if entry.device_id:
                 devices_to_check.add(entry.device_id)
 
-    # Remove each entity
     for entity_id in entities_to_remove:
-        LOGGER.info(f"Removing entity: {entity_id}")
         ent_reg.async_remove(entity_id)
 
     for device_id in devices_to_check:
-        LOGGER.info(f"Removing device: {device_id}")
         dev_reg.async_remove_device(device_id)
 
+
 def has_task_devices_entries(hass: HomeAssistant, config_id: str) -> bool:
     entity_registry = er.async_get(hass)
     entities = entity_registry.entities.get_entries_for_config_entry_id(config_id)
-    return any([entity for entity in entities if is_task_registry_entity(entity)])
+    return any(is_task_registry_entity(entity) for entity in entities)
 
 def is_task_registry_entity(entry: er.RegistryEntry) -> bool:
     return entry.unique_id.startswith(f"task_")
\ No newline at end of file
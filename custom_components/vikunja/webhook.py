@@ -0,0 +1,92 @@
+import hashlib
+import hmac
+import json
+
+from aiohttp.web import Request, Response
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from custom_components.vikunja.const import CONF_WEBHOOK_ID, CONF_WEBHOOK_SECRET, DATA_TASKS_KEY, DOMAIN, LOGGER
+from custom_components.vikunja.task_snapshot import TaskSnapshot
+
+# Header Vikunja signs the webhook body in when the webhook has a secret
+SIGNATURE_HEADER = "X-Vikunja-Signature"
+
+TASK_DELETED_EVENT = "task.deleted"
+
+# Events whose payload holds the full task, other task events (comments, attachments,
+# assignees, relations) only carry part of it
+TASK_UPSERT_EVENTS = ("task.created", "task.updated")
+
+
+@callback
+def async_register_webhook(hass: HomeAssistant, entry: ConfigEntry, coordinator) -> None:
+    """Register the endpoint Vikunja project webhooks push task events to."""
+    webhook_id = entry.data[CONF_WEBHOOK_ID]
+    secret = entry.data.get(CONF_WEBHOOK_SECRET) or ""
+
+    async def handle_webhook(hass: HomeAssistant, webhook_id: str, request: Request) -> Response:
+        body = await request.read()
+
+        if secret and not _valid_signature(secret, body, request.headers.get(SIGNATURE_HEADER, "")):
+            LOGGER.warning("Rejected Vikunja webhook with an invalid signature")
+            return Response(status=401)
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            LOGGER.warning("Rejected Vikunja webhook with an invalid body")
+            return Response(status=400)
+
+        await async_apply_webhook_event(coordinator, payload)
+        return Response(status=200)
+
+    webhook.async_register(hass, DOMAIN, entry.title, webhook_id, handle_webhook, allowed_methods=["POST"])
+    if not secret:
+        LOGGER.warning(
+            "Vikunja push updates are enabled without a webhook secret, so unsigned requests are accepted. "
+            "Set a secret in the integration options and on the Vikunja webhooks."
+        )
+    LOGGER.info(
+        f"Vikunja push updates enabled, add a project webhook in Vikunja pointing to "
+        f"{webhook.async_generate_url(hass, webhook_id)}"
+    )
+
+
+@callback
+def async_unregister_webhook(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the push endpoint of a config entry."""
+    webhook.async_unregister(hass, entry.data[CONF_WEBHOOK_ID])
+
+
+async def async_apply_webhook_event(coordinator, payload: dict) -> None:
+    """Apply a Vikunja task event directly to the coordinator's task store."""
+    event_name = payload.get("event_name") or ""
+    task_data = (payload.get("data") or {}).get("task")
+
+    if event_name not in (*TASK_UPSERT_EVENTS, TASK_DELETED_EVENT) or not task_data:
+        LOGGER.debug(f"Ignoring Vikunja webhook event {event_name}")
+        return
+
+    if coordinator.data is None:
+        return
+
+    task_id = task_data.get("id")
+    known = task_id in coordinator.data[DATA_TASKS_KEY]
+    if not known and not coordinator._is_project_selected(task_data.get("project_id")):
+        # Tasks of projects that aren't synced, nothing to update or remove
+        return
+
+    LOGGER.debug(f"Applying Vikunja webhook event {event_name} for task {task_id}")
+
+    if event_name == TASK_DELETED_EVENT:
+        if known:
+            await coordinator.async_remove_tasks({task_id})
+    else:
+        await coordinator.async_apply_task(TaskSnapshot.from_data(task_data))
+
+
+def _valid_signature(secret: str, body: bytes, signature: str) -> bool:
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
@@ -0,0 +1,64 @@
+"""Helpers of the Vikunja integration tests.
+
+Integration tests run the config entry against `FakeVikunja`, the in-process server the
+benchmark uses, through the shared client the entry would otherwise create itself.
+"""
+import httpx
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.vikunja.client import DATA_CLIENTS, SharedClient, _client_key
+from custom_components.vikunja.const import (
+    DOMAIN,
+    CONF_BASE_URL,
+    CONF_TOKEN,
+    CONF_SECS_INTERVAL,
+    CONF_STRICT_SSL,
+    CONF_SELECTED_PROJECTS,
+    CONF_ALL_PROJECTS,
+    CONF_HIDE_DONE,
+    CONF_TASKS_AS_DEVICES,
+)
+from custom_components.vikunja.coordinator import VikunjaDataUpdateCoordinator
+from fake_vikunja import FakeVikunja
+
+
+async def async_setup_vikunja(hass: HomeAssistant, fake: FakeVikunja, **data) -> MockConfigEntry:
+    """Set up a config entry backed by the fake server, `data` overrides the defaults of the entry."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=4,
+        title="Vikunja (test)",
+        data={
+            CONF_BASE_URL: "https://vikunja.test",
+            CONF_TOKEN: "token",
+            # Tests refresh on their own, keep the coordinator's timer out of the way
+            CONF_SECS_INTERVAL: 3600,
+            CONF_STRICT_SSL: True,
+            CONF_SELECTED_PROJECTS: [CONF_ALL_PROJECTS],
+            CONF_HIDE_DONE: False,
+            CONF_TASKS_AS_DEVICES: True,
+            **data,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    # The webhook endpoint is only registered with push updates, its HTTP server isn't needed
+    hass.config.components.update({"http", "webhook"})
+
+    await async_load_entry(hass, entry, fake)
+    return entry
+
+
+async def async_load_entry(hass: HomeAssistant, entry: MockConfigEntry, fake: FakeVikunja) -> None:
+    """Set up an added config entry with the fake server as the shared client of its host."""
+    shared = SharedClient(httpx.AsyncClient(transport=fake.transport()))
+    shared.unsub_close = lambda: None
+    hass.data.setdefault(DATA_CLIENTS, {})[_client_key(entry)] = shared
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+def get_coordinator(hass: HomeAssistant, entry: MockConfigEntry) -> VikunjaDataUpdateCoordinator:
+    return hass.data[DOMAIN][entry.entry_id]["coordinator"]
@@ -0,0 +1,14 @@
+"""Fixtures shared by the Vikunja tests."""
+import pytest
+
+from fake_vikunja import FakeVikunja
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    yield
+
+
+@pytest.fixture
+def fake_vikunja() -> FakeVikunja:
+    return FakeVikunja(4, 40, seed=1)
@@ -0,0 +1,208 @@
+import asyncio
+import math
+
+import httpx
+import pytest
+from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.vikunja.const import (
+    BULK_SYNC_PAGE_SIZE,
+    DOMAIN,
+    DATA_PROJECTS_KEY,
+    DATA_TASKS_KEY,
+    CONF_SELECTED_PROJECTS,
+    CONF_SYNC_TIMEOUT,
+    CONF_INCREMENTAL_SYNC,
+)
+from custom_components.vikunja.store import serialize_data
+from fake_vikunja import FakeVikunja
+from tests.common import async_load_entry, async_setup_vikunja, get_coordinator
+
+
+class FlakyVikunja(FakeVikunja):
+    """Fake server whose task listing of one project times out or is slow, or whose global listing is slow."""
+
+    timeout_project: int | None = None
+    slow_project: int | None = None
+    # Pages of the global task listing after the first one are slow
+    slow_listing: bool = False
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.slow_listing and request.url.path.endswith("/tasks/all") and request.url.params.get("page") != "1":
+            await asyncio.sleep(5)
+        if request.url.path.endswith(f"/projects/{self.timeout_project}/tasks"):
+            raise httpx.ReadTimeout("Injected timeout", request=request)
+        if request.url.path.endswith(f"/projects/{self.slow_project}/tasks"):
+            await asyncio.sleep(5)
+        return await super().handle(request)
+
+
+async def test_setup_syncs_every_task(hass, fake_vikunja):
+    entry = await async_setup_vikunja(hass, fake_vikunja)
+    coordinator = get_coordinator(hass, entry)
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert set(coordinator.data[DATA_PROJECTS_KEY]) == set(fake_vikunja.projects)
+    assert set(coordinator.data[DATA_TASKS_KEY]) == set(fake_vikunja.tasks)
+    assert len(coordinator.derived_fields) == len(fake_vikunja.tasks)
+    assert er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+
+
+async def test_incremental_sync_only_lists_changed_tasks(hass, fake_vikunja):
+    entry = await async_setup_vikunja(hass, fake_vikunja, **{CONF_INCREMENTAL_SYNC: True})
+    coordinator = get_coordinator(hass, entry)
+    touched = fake_vikunja.touch(3)
+    requests = fake_vikunja.requests
+
+    await coordinator.async_refresh()
+
+    # The projects listing and a single page of changed tasks
+    assert fake_vikunja.requests - requests == 2
+    for task_id in touched:
+        assert coordinator.data[DATA_TASKS_KEY][task_id].title == fake_vikunja.tasks[task_id]["title"]
+    assert set(coordinator.data[DATA_TASKS_KEY]) == set(fake_vikunja.tasks)
+
+
+async def test_refresh_only_updates_listeners_of_changed_tasks(hass, fake_vikunja):
+    entry = await async_setup_vikunja(hass, fake_vikunja)
+    coordinator = get_coordinator(hass, entry)
+
+    updates = {"changed": 0, "unchanged": 0, "no_context": 0}
+    changed_id = fake_vikunja.touch(1)[0]
+    unchanged_id = next(task_id for task_id in fake_vikunja.tasks if task_id != changed_id)
+    for name, context in (("changed", changed_id), ("unchanged", unchanged_id), ("no_context", None)):
+        coordinator.async_add_listener(lambda name=name: updates.__setitem__(name, updates[name] + 1), context)
+
+    await coordinator.async_refresh()
+
+    assert updates == {"changed": 1, "unchanged": 0, "no_context": 1}
+    assert coordinator.data[DATA_TASKS_KEY][changed_id].title == fake_vikunja.tasks[changed_id]["title"]
+
+
+async def test_api_calls_count_every_request_sent(hass, fake_vikunja):
+    entry = await async_setup_vikunja(hass, fake_vikunja)
+    coordinator = get_coordinator(hass, entry)
+    api_calls, requests = coordinator.api_calls, fake_vikunja.requests
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    assert fake_vikunja.requests > requests
+    assert coordinator.api_calls - api_calls == fake_vikunja.requests - requests
+
+
+async def test_setup_retries_when_vikunja_is_unreachable(hass, fake_vikunja):
+    fake_vikunja.fail_next(1, status=502)
+
+    entry = await async_setup_vikunja(hass, fake_vikunja)
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+
+
+async def test_setup_asks_for_a_new_token_when_vikunja_rejects_it(hass, fake_vikunja):
+    fake_vikunja.fail_next(1, status=401)
+
+    entry = await async_setup_vikunja(hass, fake_vikunja)
+
+    assert entry.state is ConfigEntryState.SETUP_ERROR
+    assert [flow["context"]["source"] for flow in hass.config_entries.flow.async_progress_by_handler(DOMAIN)] == [
+        SOURCE_REAUTH
+    ]
+
+
+async def test_setup_from_snapshot_does_not_wait_for_vikunja(hass, hass_storage, fake_vikunja):
+    entry = await async_setup_vikunja(hass, fake_vikunja)
+    coordinator = get_coordinator(hass, entry)
+    snapshot = serialize_data(coordinator._vikunja_api.web_ui_link, coordinator.data)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+    hass_storage[f"vikunja.{entry.entry_id}"] = {"version": 1, "minor_version": 1, "key": f"vikunja.{entry.entry_id}",
+                                                 "data": snapshot}
+    requests = fake_vikunja.requests
+    fake_vikunja.fail_next(1, status=401)
+    await async_load_entry(hass, entry, fake_vikunja)
+    coordinator = get_coordinator(hass, entry)
+
+    # Set up from the snapshot, the background refresh then reports the rejected token
+    assert entry.state is ConfigEntryState.LOADED
+    assert coordinator.restored_from_snapshot
+    assert set(coordinator.data[DATA_TASKS_KEY]) == set(fake_vikunja.tasks)
+    assert fake_vikunja.requests - requests == 1
+    assert not coordinator.last_update_success
+    assert [flow["context"]["source"] for flow in hass.config_entries.flow.async_progress_by_handler(DOMAIN)] == [
+        SOURCE_REAUTH
+    ]
+
+
+async def test_request_timeout_fails_the_project(hass):
+    fake = FlakyVikunja(5, 50, seed=1)
+    # Two of five projects are fetched one by one instead of through the global listing
+    entry = await async_setup_vikunja(hass, fake, **{CONF_SELECTED_PROJECTS: ["1", "2"]})
+    coordinator = get_coordinator(hass, entry)
+    project_tasks = set(coordinator.data[DATA_TASKS_KEY])
+
+    fake.timeout_project = 1
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert set(coordinator.failed_projects) == {1}
+    assert coordinator.stale_projects == set()
+    # The tasks of the failed project are kept
+    assert set(coordinator.data[DATA_TASKS_KEY]) == project_tasks
+
+
+async def test_sync_budget_marks_unfinished_projects_stale(hass):
+    fake = FlakyVikunja(5, 50, seed=1)
+    entry = await async_setup_vikunja(hass, fake, **{CONF_SELECTED_PROJECTS: ["1", "2"], CONF_SYNC_TIMEOUT: 0.5})
+    coordinator = get_coordinator(hass, entry)
+    project_tasks = set(coordinator.data[DATA_TASKS_KEY])
+
+    fake.slow_project = 1
+    touched = next(task_id for task_id, task in fake.tasks.items() if task["project_id"] == 2)
+    fake.tasks[touched]["title"] = "Changed"
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.stale_projects == {1}
+    assert coordinator.failed_projects == {}
+    assert set(coordinator.data[DATA_TASKS_KEY]) == project_tasks
+    assert coordinator.data[DATA_TASKS_KEY][touched].title == "Changed"
+
+
+async def test_sync_budget_running_out_during_the_listing_keeps_the_received_pages(hass):
+    fake = FlakyVikunja(4, 120, seed=1)
+    fake.slow_listing = True
+
+    # Only the first of three listing pages arrives within the budget
+    entry = await async_setup_vikunja(hass, fake, **{CONF_SYNC_TIMEOUT: 0.5})
+    coordinator = get_coordinator(hass, entry)
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert coordinator.stale_projects == set(fake.projects)
+    assert len(coordinator.data[DATA_TASKS_KEY]) == 50
+
+    # The next sync fetches the projects one by one instead of running out again
+    listings = fake.requests_by_route["GET /tasks/all"]
+    project_listings = fake.requests_by_route["GET /projects/{id}/tasks"]
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert fake.requests_by_route["GET /tasks/all"] == listings
+    assert fake.requests_by_route["GET /projects/{id}/tasks"] - project_listings >= len(fake.projects)
+    assert coordinator.stale_projects == set()
+    assert set(coordinator.data[DATA_TASKS_KEY]) == set(fake.tasks)
+
+
+@pytest.mark.parametrize(("projects", "tasks"), [(4, 40), (10, 400)])
+async def test_startup_syncs_once_whatever_the_task_count(hass, projects, tasks):
+    fake = FakeVikunja(projects, tasks, seed=1)
+
+    entry = await async_setup_vikunja(hass, fake)
+    coordinator = get_coordinator(hass, entry)
+
+    # One page of projects and the pages of the global task listing, no request per entity
+    assert coordinator.sync_count == 1
+    assert coordinator.api_calls == 1 + math.ceil(tasks / BULK_SYNC_PAGE_SIZE)
+    # The connection check before the first sync goes around the request cache
+    assert fake.requests == coordinator.api_calls + 1
@@ -0,0 +1,86 @@
+import dataclasses
+from datetime import timedelta
+
+from custom_components.vikunja.derived_fields import DerivedFieldCache, derive_task_fields
+from custom_components.vikunja.repeat import RepeatUnit
+from custom_components.vikunja.task_snapshot import TaskAssignee, TaskLabel, TaskSnapshot
+from fake_vikunja import FakeVikunja
+
+
+def make_task(**changes) -> TaskSnapshot:
+    task = TaskSnapshot.from_data(FakeVikunja(1, 1, seed=3).tasks[1])
+    return dataclasses.replace(task, **changes)
+
+
+def test_derive_task_fields():
+    task = make_task(
+        repeat_after=timedelta(weeks=2),
+        labels=(TaskLabel(2, "Work", "1973ff"), TaskLabel(1, "Home", None)),
+        assignees=(TaskAssignee(1, "Alex", "alex"), TaskAssignee(2, "", "sam")),
+    )
+
+    fields = derive_task_fields(task)
+
+    assert (fields.repeat_unit, fields.repeat_value) == (RepeatUnit.WEEKS, 2)
+    assert fields.labels_text == "Home, Work"
+    assert fields.labels_attributes == {"labels": [
+        {"id": 1, "title": "Home", "color": None},
+        {"id": 2, "title": "Work", "color": "1973ff"},
+    ]}
+    assert fields.assignees_text == "Alex, sam"
+
+
+def test_derive_task_fields_without_labels_or_assignees():
+    fields = derive_task_fields(make_task(repeat_after=None, labels=(), assignees=()))
+
+    assert (fields.repeat_unit, fields.repeat_value) == (None, None)
+    assert fields.labels_text == "No labels"
+    assert fields.assignees_text == "Unassigned"
+
+
+def test_get_recomputes_only_when_updated_changes():
+    cache = DerivedFieldCache()
+    task = make_task(labels=())
+
+    fields = cache.get(task)
+    assert cache.get(task) is fields
+    assert cache.computed == 1
+
+    # A different title under the same `updated` time is still the same task version
+    assert cache.get(dataclasses.replace(task, title="Renamed")) is fields
+
+    changed = dataclasses.replace(task, labels=(TaskLabel(1, "Home", None),), updated=task.updated + timedelta(minutes=1))
+    assert cache.get(changed).labels_text == "Home"
+    assert cache.computed == 2
+
+
+def test_get_always_recomputes_without_updated_time():
+    cache = DerivedFieldCache()
+    task = make_task(updated=None)
+
+    cache.get(task)
+    cache.get(task)
+
+    assert cache.computed == 2
+
+
+def test_update_recomputes_whatever_updated_says():
+    cache = DerivedFieldCache()
+    task = make_task(labels=())
+    cache.get(task)
+
+    # Labels are changed through their own endpoint, which doesn't bump `updated`
+    relabelled = dataclasses.replace(task, labels=(TaskLabel(1, "Home", None),))
+    cache.update([relabelled])
+
+    assert cache.get(relabelled).labels_text == "Home"
+    assert cache.computed == 2
+
+
+def test_forget():
+    cache = DerivedFieldCache()
+    cache.update([make_task(id=1), make_task(id=2)])
+
+    cache.forget([1, 3])
+
+    assert len(cache) == 1
@@ -0,0 +1,66 @@
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.vikunja.due_scheduler import DueDateScheduler
+
+
+def make_scheduler(hass) -> tuple[DueDateScheduler, list[set[int]]]:
+    notified: list[set[int]] = []
+    return DueDateScheduler(hass, notified.append), notified
+
+
+async def test_notifies_when_due_dates_pass(hass):
+    scheduler, notified = make_scheduler(hass)
+    now = dt_util.utcnow()
+    scheduler.async_set_tasks({1: now + timedelta(minutes=1), 2: now + timedelta(minutes=1), 3: now + timedelta(hours=1)})
+
+    async_fire_time_changed(hass, now + timedelta(minutes=2))
+    await hass.async_block_till_done()
+    assert notified == [{1, 2}]
+
+    async_fire_time_changed(hass, now + timedelta(hours=2))
+    await hass.async_block_till_done()
+    assert notified == [{1, 2}, {3}]
+    scheduler.async_shutdown()
+
+
+async def test_moved_and_removed_due_dates_are_skipped(hass):
+    scheduler, notified = make_scheduler(hass)
+    now = dt_util.utcnow()
+    scheduler.async_set_tasks({1: now + timedelta(minutes=1), 2: now + timedelta(minutes=1)})
+
+    # The old heap entries stay behind and must not fire
+    scheduler.async_set_task(1, now + timedelta(hours=1))
+    scheduler.async_set_task(2, None)
+
+    async_fire_time_changed(hass, now + timedelta(minutes=2))
+    await hass.async_block_till_done()
+    assert notified == []
+
+    async_fire_time_changed(hass, now + timedelta(hours=2))
+    await hass.async_block_till_done()
+    assert notified == [{1}]
+    scheduler.async_shutdown()
+
+
+async def test_past_due_dates_are_not_scheduled(hass):
+    scheduler, notified = make_scheduler(hass)
+    scheduler.async_set_task(1, dt_util.utcnow() - timedelta(minutes=1))
+
+    assert scheduler._heap == []
+    assert scheduler._unsub_timer is None
+
+
+async def test_stale_entries_are_compacted(hass):
+    scheduler, _ = make_scheduler(hass)
+    now = dt_util.utcnow()
+
+    # A task moved over and over again leaves a stale entry behind each time
+    for minutes in range(1, 1001):
+        scheduler.async_set_task(1, now + timedelta(minutes=minutes))
+
+    assert len(scheduler._heap) <= 2 * len(scheduler._due_dates) + 64
+    assert scheduler._armed_for == now + timedelta(minutes=1000)
+    scheduler.async_shutdown()
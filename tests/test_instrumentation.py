@@ -0,0 +1,52 @@
+from custom_components.vikunja.instrumentation import SAMPLE_WINDOW, Instrumentation, RollingStats
+
+
+def test_percentiles_use_nearest_rank():
+    stats = RollingStats()
+    for value in range(1, 11):
+        stats.record(value)
+
+    assert stats.percentile(50) == 5
+    assert stats.percentile(95) == 10
+    assert stats.percentile(99) == 10
+    assert stats.percentile(10) == 1
+    assert stats.percentile(0) == 1
+
+
+def test_percentiles_without_samples():
+    stats = RollingStats()
+
+    assert stats.percentile(50) is None
+    assert stats.as_dict() == {
+        "count": 0, "last": None, "mean": None, "p50": None, "p95": None, "p99": None, "max": None,
+    }
+
+
+def test_percentiles_only_cover_the_recent_samples():
+    stats = RollingStats()
+    stats.record(1000)
+    for _ in range(SAMPLE_WINDOW):
+        stats.record(1)
+
+    assert stats.count == SAMPLE_WINDOW + 1
+    assert stats.as_dict()["max"] == 1
+    # The mean still covers every sample
+    assert stats.as_dict(digits=2)["mean"] == round((1000 + SAMPLE_WINDOW) / (SAMPLE_WINDOW + 1), 2)
+
+
+def test_measure_records_milliseconds_also_when_raising():
+    instrumentation = Instrumentation()
+
+    try:
+        with instrumentation.measure("sync"):
+            raise ValueError
+    except ValueError:
+        pass
+    instrumentation.record_timing("sync", 0.25)
+    instrumentation.record_size("sync_bytes", 2048)
+
+    assert instrumentation.timing("sync").count == 2
+    assert instrumentation.timing("sync").last == 250
+    assert instrumentation.size("sync_bytes").last == 2048
+    assert instrumentation.timing("dispatch") is None
+    assert set(instrumentation.as_dict()) == {"timings_ms", "sizes"}
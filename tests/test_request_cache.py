@@ -0,0 +1,115 @@
+import httpx
+import pytest
+from pyvikunja.api import APIError, VikunjaAPI
+
+from custom_components.vikunja.request_cache import ConditionalRequestCache
+from fake_vikunja import FakeVikunja
+
+
+def make_cache(handler) -> ConditionalRequestCache:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return ConditionalRequestCache(VikunjaAPI("https://vikunja.test", "token", True, client))
+
+
+class ETagServer:
+    """Serves the fake server's listings with an ETag, answering matching revalidations with 304."""
+
+    def __init__(self, fake: FakeVikunja):
+        self.fake = fake
+        self.requests: list[httpx.Request] = []
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = await self.fake.handle(request)
+        await response.aread()
+        etag = f'"{hash(response.content)}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        return httpx.Response(response.status_code, content=response.content, headers={**response.headers, "etag": etag})
+
+
+async def test_unchanged_pages_are_revalidated_with_their_etag():
+    server = ETagServer(FakeVikunja(2, 60, seed=4))
+    cache = make_cache(server.handle)
+
+    first = await cache.async_get_tasks(1)
+    second = await cache.async_get_tasks(1)
+
+    assert len(first) == 30
+    assert all(new is old for new, old in zip(second, first))
+    assert "if-none-match" not in server.requests[0].headers
+    assert "if-none-match" in server.requests[-1].headers
+    # Two pages of 20 tasks, both revalidated
+    assert cache.not_modified == 2
+    assert cache.requests == 4
+
+
+async def test_changed_pages_are_parsed_again():
+    fake = FakeVikunja(1, 10, seed=4)
+    cache = make_cache(ETagServer(fake).handle)
+
+    first = await cache.async_get_tasks(1)
+    touched = fake.touch(1)[0]
+    second = await cache.async_get_tasks(1)
+
+    assert cache.not_modified == 0
+    assert cache.misses == 2
+    assert next(task for task in second if task.id == touched) != next(task for task in first if task.id == touched)
+
+
+async def test_pages_without_validators_are_compared_by_content():
+    fake = FakeVikunja(1, 45, seed=4)
+    cache = make_cache(fake.handle)
+
+    first = await cache.async_get_tasks(1)
+    second = await cache.async_get_tasks(1)
+
+    # Three pages of 20 tasks, sent in full both times but only parsed once
+    assert cache.requests == 6
+    assert (cache.hits, cache.misses, cache.not_modified) == (3, 3, 0)
+    assert all(new is old for new, old in zip(second, first))
+    assert cache.bytes_received > 0
+
+
+async def test_shrinking_listing_drops_the_pages_after_its_end():
+    fake = FakeVikunja(1, 45, seed=4)
+    cache = make_cache(fake.handle)
+    await cache.async_get_tasks(1)
+
+    for task_id in range(1, 31):
+        del fake.tasks[task_id]
+
+    assert [task.id for task in await cache.async_get_tasks(1)] == list(range(31, 46))
+    assert cache.stats["cached_pages"] == 1
+
+
+async def test_uncached_pages_are_neither_revalidated_nor_kept():
+    server = ETagServer(FakeVikunja(1, 10, seed=4))
+    cache = make_cache(server.handle)
+    params = {"filter": "updated >= 2025-01-01T00:00:00Z", "page": 1, "per_page": 50}
+
+    await cache.async_get_page("/tasks/all", params, cache.parse_task, cache=False)
+    tasks, total_pages = await cache.async_get_page("/tasks/all", params, cache.parse_task, cache=False)
+
+    assert (len(tasks), total_pages) == (10, 1)
+    assert all("if-none-match" not in request.headers for request in server.requests)
+    assert cache.stats["cached_pages"] == 0
+    assert cache.requests == 2
+    assert (cache.uncached, cache.hits, cache.misses) == (2, 0, 0)
+
+
+async def test_errors_are_raised_as_api_errors():
+    fake = FakeVikunja(1, 1, seed=4)
+    cache = make_cache(fake.handle)
+
+    fake.fail_next(1, status=502)
+    with pytest.raises(APIError) as error:
+        await cache.async_get_projects()
+    assert error.value.status_code == 502
+
+    # A request timeout is not the coordinator's sync budget running out
+    fake.timeout_rate = 1
+    with pytest.raises(APIError) as error:
+        await cache.async_get_projects()
+    assert not isinstance(error.value, TimeoutError)
+    assert cache.requests == 2
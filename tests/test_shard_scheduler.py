@@ -0,0 +1,88 @@
+import pytest
+
+from custom_components.vikunja.shard_scheduler import CHANGE_RATE_WEIGHT, ShardScheduler
+
+PROJECTS = list(range(1, 11))
+
+
+def test_first_sync_refreshes_every_project():
+    scheduler = ShardScheduler()
+
+    assert scheduler.select(PROJECTS, interval=60, window=600, now=0) == set(PROJECTS)
+
+
+def test_shard_size_covers_every_project_within_the_window():
+    scheduler = ShardScheduler()
+    scheduler.record({project_id: False for project_id in PROJECTS}, now=0)
+
+    # 10 projects synced every 60 seconds within 600 seconds, one project per sync
+    assert len(scheduler.select(PROJECTS, interval=60, window=600, now=60)) == 1
+    # Syncing every 300 seconds leaves two syncs for the window, so half of the projects each
+    assert len(scheduler.select(PROJECTS, interval=300, window=600, now=300)) == 5
+
+
+def test_projects_rotate_until_each_was_refreshed():
+    scheduler = ShardScheduler()
+    scheduler.record({project_id: False for project_id in PROJECTS}, now=0)
+
+    refreshed = set()
+    for sync in range(1, 11):
+        now = sync * 60
+        shard = scheduler.select(PROJECTS, interval=60, window=600, now=now)
+        scheduler.record({project_id: False for project_id in shard}, now=now)
+        refreshed |= shard
+
+    assert refreshed == set(PROJECTS)
+
+
+def test_projects_not_synced_for_a_window_are_always_included():
+    scheduler = ShardScheduler()
+    scheduler.record({project_id: False for project_id in PROJECTS[:5]}, now=0)
+    scheduler.record({project_id: False for project_id in PROJECTS[5:]}, now=500)
+
+    shard = scheduler.select(PROJECTS, interval=60, window=600, now=600)
+
+    assert set(PROJECTS[:5]) <= shard
+
+
+def test_dirty_projects_go_first():
+    scheduler = ShardScheduler()
+    scheduler.record({project_id: False for project_id in PROJECTS}, now=0)
+    scheduler.mark_dirty(7)
+
+    assert scheduler.select(PROJECTS, interval=60, window=600, now=60) == {7}
+
+    scheduler.record({7: False}, now=60)
+    assert 7 not in scheduler.select(PROJECTS, interval=60, window=600, now=120)
+
+
+def test_frequently_changing_projects_rank_higher():
+    scheduler = ShardScheduler()
+    scheduler.record({project_id: project_id == 3 for project_id in PROJECTS}, now=0)
+
+    # Every project is equally old, the one that changed wins
+    assert scheduler.select(PROJECTS, interval=60, window=600, now=60) == {3}
+
+
+def test_change_rate_is_an_exponentially_weighted_average():
+    scheduler = ShardScheduler()
+    scheduler.record({1: True}, now=0)
+    scheduler.record({1: False}, now=60)
+
+    assert scheduler._change_rates[1] == pytest.approx(CHANGE_RATE_WEIGHT * (1 - CHANGE_RATE_WEIGHT))
+
+    # An older change loses against a recent one of the same age
+    scheduler.record({2: False}, now=0)
+    scheduler.record({2: True}, now=60)
+    assert scheduler.select([1, 2], interval=60, window=6000, now=120) == {2}
+
+
+def test_forgotten_projects_start_over():
+    scheduler = ShardScheduler()
+    scheduler.record({project_id: False for project_id in PROJECTS}, now=0)
+    scheduler.mark_dirty(4)
+    scheduler.forget([4])
+
+    # A project that's synced again counts as never synced
+    assert 4 in scheduler.select(PROJECTS, interval=60, window=600, now=60)
+    assert 4 not in scheduler._dirty
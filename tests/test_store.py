@@ -0,0 +1,39 @@
+import httpx
+from pyvikunja.api import VikunjaAPI
+from pyvikunja.models.project import Project
+
+from custom_components.vikunja.const import DATA_PROJECTS_KEY, DATA_TASKS_KEY
+from custom_components.vikunja.store import deserialize_data, serialize_data
+from custom_components.vikunja.task_snapshot import TaskSnapshot
+from fake_vikunja import FakeVikunja
+
+
+def make_api(base_url: str) -> VikunjaAPI:
+    return VikunjaAPI(base_url, "token", True, httpx.AsyncClient())
+
+
+def make_data(api: VikunjaAPI) -> dict:
+    fake = FakeVikunja(2, 20, seed=5)
+    return {
+        DATA_PROJECTS_KEY: {project_id: Project(api, data) for project_id, data in fake.projects.items()},
+        DATA_TASKS_KEY: {task_id: TaskSnapshot.from_data(data) for task_id, data in fake.tasks.items()},
+    }
+
+
+def test_snapshot_round_trip():
+    api = make_api("https://vikunja.test")
+    data = make_data(api)
+
+    projects, tasks = deserialize_data(api, serialize_data(api.web_ui_link, data))
+
+    assert tasks == data[DATA_TASKS_KEY]
+    assert {project_id: project.title for project_id, project in projects.items()} == {
+        project_id: project.title for project_id, project in data[DATA_PROJECTS_KEY].items()
+    }
+
+
+def test_snapshot_of_another_instance_is_discarded():
+    api = make_api("https://vikunja.test")
+    snapshot = serialize_data(api.web_ui_link, make_data(api))
+
+    assert deserialize_data(make_api("https://other.test"), snapshot) is None
@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+from pyvikunja.models.enum.repeat_mode import RepeatMode
+from pyvikunja.models.enum.task_priority import Priority
+
+from custom_components.vikunja.task_snapshot import TaskAssignee, TaskLabel, TaskSnapshot
+from fake_vikunja import FakeVikunja
+
+
+def test_round_trip_keeps_every_field():
+    fake = FakeVikunja(3, 200, repeat_ratio=0.5, label_ratio=0.5, assignee_ratio=0.5, seed=1)
+
+    for task_data in fake.tasks.values():
+        task = TaskSnapshot.from_data(task_data)
+        assert TaskSnapshot.from_data(task.as_data()) == task
+
+
+def test_from_data_parses_the_vikunja_fields():
+    task = TaskSnapshot.from_data({
+        "id": 7,
+        "project_id": 2,
+        "title": "Water the plants",
+        "description": "",
+        "done": False,
+        "due_date": "2026-01-02T08:00:00Z",
+        "start_date": "0001-01-01T00:00:00Z",
+        "end_date": "0001-01-01T00:00:00Z",
+        "priority": 3,
+        "repeat_after": 86400,
+        "repeat_mode": 0,
+        "labels": [{"id": 1, "title": "Garden", "hex_color": "3cb371"}],
+        "assignees": [{"id": 4, "name": "", "username": "sam"}],
+        "updated": "2026-01-01T00:00:00Z",
+    })
+
+    assert task.due_date is not None and task.due_date.tzinfo is not None
+    assert task.start_date is None
+    assert task.priority == Priority.HIGH
+    assert task.repeat_after == timedelta(days=1)
+    assert task.repeat_enabled
+    assert task.repeat_mode == RepeatMode.DEFAULT
+    assert task.labels == (TaskLabel(1, "Garden", "3cb371"),)
+    assert task.assignees == (TaskAssignee(4, "", "sam"),)
+
+
+def test_snapshots_compare_by_value():
+    fake = FakeVikunja(1, 1, seed=2)
+    task_data = fake.tasks[1]
+
+    assert TaskSnapshot.from_data(task_data) == TaskSnapshot.from_data(dict(task_data))
+    assert TaskSnapshot.from_data(task_data) != TaskSnapshot.from_data({**task_data, "title": "Changed"})
@@ -0,0 +1,43 @@
+import asyncio
+
+from custom_components.vikunja.util import gather_with_limit, registry_owner_key
+
+
+async def test_gather_with_limit_keeps_order_and_collects_exceptions():
+    async def double(value: int) -> int:
+        await asyncio.sleep(0.01 * (5 - value))
+        if value == 3:
+            raise ValueError(value)
+        return value * 2
+
+    results = await gather_with_limit([1, 2, 3, 4], double, limit=2)
+
+    assert [item for item, _ in results] == [1, 2, 3, 4]
+    assert [result for item, result in results if item != 3] == [2, 4, 8]
+    assert isinstance(results[2][1], ValueError)
+
+
+async def test_gather_with_limit_bounds_calls_in_flight():
+    in_flight = 0
+    most_in_flight = 0
+
+    async def track(_: int) -> None:
+        nonlocal in_flight, most_in_flight
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    await gather_with_limit(list(range(10)), track, limit=3)
+    assert most_in_flight == 3
+
+    # A limit below one still runs the calls, one at a time
+    most_in_flight = 0
+    await gather_with_limit(list(range(3)), track, limit=0)
+    assert most_in_flight == 1
+
+
+def test_registry_owner_key():
+    assert registry_owner_key("task_12_due_date") == ("task", "12")
+    assert registry_owner_key("todo_list_3") == ("project", "3")
+    assert registry_owner_key("project_3_open_tasks") == ("project", "3")
@@ -0,0 +1,47 @@
+from custom_components.vikunja.const import DATA_TASKS_KEY, CONF_SELECTED_PROJECTS
+from custom_components.vikunja.webhook import async_apply_webhook_event
+from tests.common import async_setup_vikunja, get_coordinator
+
+
+def event(name: str, task: dict) -> dict:
+    return {"event_name": name, "time": "2026-01-01T00:00:00Z", "data": {"task": task}}
+
+
+async def test_task_events_update_the_synced_tasks(hass, fake_vikunja):
+    entry = await async_setup_vikunja(hass, fake_vikunja)
+    coordinator = get_coordinator(hass, entry)
+    task = fake_vikunja.tasks[1]
+
+    await async_apply_webhook_event(coordinator, event("task.updated", {**task, "title": "Pushed"}))
+    assert coordinator.data[DATA_TASKS_KEY][1].title == "Pushed"
+
+    await async_apply_webhook_event(coordinator, event("task.created", {**task, "id": 1000, "title": "New"}))
+    assert coordinator.data[DATA_TASKS_KEY][1000].title == "New"
+
+    await async_apply_webhook_event(coordinator, event("task.deleted", {**task, "id": 1000}))
+    await hass.async_block_till_done()
+    assert 1000 not in coordinator.data[DATA_TASKS_KEY]
+
+
+async def test_partial_task_events_are_ignored(hass, fake_vikunja):
+    entry = await async_setup_vikunja(hass, fake_vikunja)
+    coordinator = get_coordinator(hass, entry)
+    task = coordinator.data[DATA_TASKS_KEY][1]
+
+    # Comment events only carry part of the task
+    await async_apply_webhook_event(coordinator, event("task.comment.created", {"id": 1, "title": ""}))
+
+    assert coordinator.data[DATA_TASKS_KEY][1] is task
+
+
+async def test_tasks_of_unselected_projects_are_dropped(hass, fake_vikunja):
+    entry = await async_setup_vikunja(hass, fake_vikunja, **{CONF_SELECTED_PROJECTS: ["1"]})
+    coordinator = get_coordinator(hass, entry)
+    task = next(task for task in fake_vikunja.tasks.values() if task["project_id"] == 2)
+    tasks = dict(coordinator.data[DATA_TASKS_KEY])
+
+    await async_apply_webhook_event(coordinator, event("task.created", task))
+    await async_apply_webhook_event(coordinator, event("task.deleted", task))
+    await hass.async_block_till_done()
+
+    assert coordinator.data[DATA_TASKS_KEY] == tasks
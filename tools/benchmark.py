@@ -0,0 +1,249 @@
+"""Benchmark the Vikunja integration against an in-process fake Vikunja server.
+
+Each scenario sets up a config entry with all platforms in a bare Home Assistant
+instance, then runs a number of polls with some tasks changed before each one.
+
+Usage:
+    python tools/benchmark.py
+    python tools/benchmark.py --scenario 100x1000 --polls 10 --changes 20
+    python tools/benchmark.py --scenario 1000x10000 --set tasks_as_devices=false --set project_summary=true
+    python tools/benchmark.py --scenario 100x1000 --latency 0.2 --jitter 0.3 --error-rate 0.05
+
+Scenarios are PROJECTSxTASKS, with the tasks spread evenly across the projects.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from types import MappingProxyType
+
+import httpx
+
+from fake_vikunja import FakeVikunja
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_SCENARIOS = ["10x100", "100x1000", "1000x10000"]
+
+
+class Result:
+    """Measurements of one scenario."""
+
+    def __init__(self, scenario: str):
+        self.scenario = scenario
+        self.setup_seconds = 0.0
+        self.setup_requests = 0
+        self.entities = 0
+        self.poll_seconds: list[float] = []
+        self.poll_requests: list[int] = []
+        self.poll_state_writes: list[int] = []
+        self.peak_memory: int | None = None
+
+    def as_dict(self) -> dict:
+        return {
+            "scenario": self.scenario,
+            "setup_seconds": round(self.setup_seconds, 3),
+            "setup_requests": self.setup_requests,
+            "entities": self.entities,
+            "poll_seconds_median": round(statistics.median(self.poll_seconds), 3) if self.poll_seconds else None,
+            "poll_seconds_max": round(max(self.poll_seconds), 3) if self.poll_seconds else None,
+            "requests_per_poll": statistics.mean(self.poll_requests) if self.poll_requests else None,
+            "state_writes_per_poll": statistics.mean(self.poll_state_writes) if self.poll_state_writes else None,
+            "peak_memory_mb": round(self.peak_memory / 2 ** 20, 1) if self.peak_memory is not None else None,
+        }
+
+
+async def async_start_hass(config_dir: str):
+    """Start a Home Assistant instance with just the base functionality loaded."""
+    from homeassistant import bootstrap, config_entries, core, loader
+    from homeassistant.helpers import frame
+
+    hass = core.HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    frame.async_setup(hass)
+    await bootstrap.async_load_base_functionality(hass)
+
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+
+    # The webhook push endpoint isn't used, so its HTTP server dependencies are not started
+    hass.config.components.update({"http", "webhook"})
+    hass.set_state(core.CoreState.running)
+    return hass
+
+
+def build_entry(options: dict):
+    from homeassistant.config_entries import ConfigEntry
+
+    from custom_components.vikunja.const import (
+        DOMAIN,
+        CONF_BASE_URL,
+        CONF_TOKEN,
+        CONF_SECS_INTERVAL,
+        CONF_STRICT_SSL,
+        CONF_SELECTED_PROJECTS,
+        CONF_ALL_PROJECTS,
+        CONF_HIDE_DONE,
+        CONF_TASKS_AS_DEVICES,
+    )
+
+    return ConfigEntry(
+        data={
+            CONF_BASE_URL: "https://vikunja.bench",
+            CONF_TOKEN: "bench",
+            # Polls are run by the benchmark, keep the coordinator's own timer out of the way
+            CONF_SECS_INTERVAL: 3600,
+            CONF_STRICT_SSL: True,
+            CONF_SELECTED_PROJECTS: [CONF_ALL_PROJECTS],
+            CONF_HIDE_DONE: False,
+            CONF_TASKS_AS_DEVICES: True,
+            **options,
+        },
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options={},
+        source="user",
+        title="Vikunja (benchmark)",
+        unique_id=None,
+        version=4,
+    )
+
+
+def use_fake_server(hass, entry, fake: FakeVikunja) -> None:
+    """Register a client backed by the fake server as the shared client of the entry's host."""
+    from custom_components.vikunja.client import DATA_CLIENTS, SharedClient, _client_key
+
+    shared = SharedClient(httpx.AsyncClient(transport=fake.transport()))
+    shared.unsub_close = lambda: None
+    hass.data.setdefault(DATA_CLIENTS, {})[_client_key(entry)] = shared
+
+
+async def async_run_scenario(scenario: str, args, options: dict) -> Result:
+    from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+    from homeassistant.core import callback
+    from homeassistant.helpers import entity_registry as er
+
+    from custom_components.vikunja.const import DOMAIN
+
+    projects, tasks = (int(part) for part in scenario.lower().split("x"))
+    result = Result(scenario)
+    fake = FakeVikunja(projects, tasks, seed=args.seed)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+
+        state_writes = 0
+
+        @callback
+        def count_state_write(event_data) -> bool:
+            nonlocal state_writes
+            state_writes += 1
+            return False
+
+        @callback
+        def ignore_event(event) -> None:
+            pass
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, ignore_event, event_filter=count_state_write)
+        hass.bus.async_listen(EVENT_STATE_REPORTED, ignore_event, event_filter=count_state_write)
+
+        entry = build_entry(options)
+        use_fake_server(hass, entry, fake)
+
+        memory = not args.no_memory
+        if memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        await hass.config_entries.async_add(entry)
+        await hass.async_block_till_done()
+        result.setup_seconds = time.perf_counter() - start
+        result.setup_requests = fake.requests
+        result.entities = len(er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id))
+
+        # Setup runs against a healthy server, the polls against the configured one
+        fake.latency, fake.jitter = args.latency, args.jitter
+        fake.error_rate, fake.timeout_rate = args.error_rate, args.timeout_rate
+
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+        for _ in range(args.polls):
+            fake.touch(args.changes)
+            requests, state_writes = fake.requests, 0
+
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+            result.poll_seconds.append(time.perf_counter() - start)
+            result.poll_requests.append(fake.requests - requests)
+            result.poll_state_writes.append(state_writes)
+
+        if memory:
+            result.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_stop(force=True)
+
+    return result
+
+
+def parse_option(value: str) -> tuple[str, object]:
+    key, _, raw = value.partition("=")
+    try:
+        return key, json.loads(raw)
+    except ValueError:
+        return key, raw
+
+
+def print_table(results: list[Result]) -> None:
+    rows = [result.as_dict() for result in results]
+    columns = list(rows[0].keys())
+    widths = {column: max(len(column), *(len(str(row[column])) for row in rows)) for column in columns}
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+    for row in rows:
+        print("  ".join(str(row[column]).ljust(widths[column]) for column in columns))
+
+
+async def async_main(args) -> None:
+    options = dict(parse_option(value) for value in args.set)
+    results = []
+    for scenario in args.scenario or DEFAULT_SCENARIOS:
+        print(f"Running {scenario}...", file=sys.stderr)
+        results.append(await async_run_scenario(scenario, args, options))
+
+    if args.json:
+        print(json.dumps([result.as_dict() for result in results], indent=2))
+    else:
+        print_table(results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", help="PROJECTSxTASKS, can be given more than once")
+    parser.add_argument("--polls", type=int, default=5, help="Polls to run after setup")
+    parser.add_argument("--changes", type=int, default=10, help="Tasks changed before each poll")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the fake server delays each poll request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra delay of up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of poll requests answered with a 500")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Share of poll requests that time out")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated dataset")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="Config entry option, the value is parsed as JSON when possible")
+    parser.add_argument("--no-memory", action="store_true", help="Skip peak memory tracing, which slows down the run")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args()
+
+    # Makes the integration importable as a custom component
+    sys.path.insert(0, str(REPO_ROOT))
+    asyncio.run(async_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""In-process fake of the Vikunja API, served through an httpx mock transport.
+
+Implements the endpoints pyvikunja uses: the projects listing (which is also the
+ping), project and global task listings, task create/read/update/delete and labels.
+Datasets are generated from a seed, so runs with the same arguments see the same
+projects, labels and tasks. Latency, errors and timeouts can be injected to test
+how the integration behaves against a slow or flaky server.
+
+Use it with an `httpx.AsyncClient`, responses are delayed with asyncio.
+"""
+import asyncio
+import json
+import math
+import random
+import re
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import httpx
+
+NO_DATE = "0001-01-01T00:00:00Z"
+
+# Largest page Vikunja serves by default, whatever per_page asks for
+MAX_PER_PAGE = 50
+
+UPDATED_FILTER = re.compile(r"updated\s*>=\s*(\S+)")
+
+LABEL_COLORS = ["e8445a", "1973ff", "7f23ff", "ff9f69", "3cb371"]
+
+
+def _format_date(date: Optional[datetime]) -> str:
+    return date.strftime("%Y-%m-%dT%H:%M:%SZ") if date else NO_DATE
+
+
+def _parse_date(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class FakeVikunja:
+    """A Vikunja server holding `projects` projects with `tasks` tasks spread across them.
+
+    The ratios control the share of generated tasks that are done, have a due date,
+    repeat, carry labels or have an assignee.
+    """
+
+    def __init__(
+            self,
+            projects: int,
+            tasks: int,
+            *,
+            labels: int = 10,
+            users: int = 3,
+            done_ratio: float = 0.2,
+            due_ratio: float = 0.5,
+            repeat_ratio: float = 0.1,
+            label_ratio: float = 0.3,
+            assignee_ratio: float = 0.2,
+            max_per_page: int = MAX_PER_PAGE,
+            seed: int = 0,
+    ):
+        self._random = random.Random(seed)
+        # Separate from the dataset generator, so injected faults don't change which tasks `touch` picks
+        self._faults = random.Random(seed)
+        self._now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.max_per_page = max_per_page
+
+        # Fixed delay of every response plus a random jitter of up to `jitter`, in seconds
+        self.latency = 0.0
+        self.jitter = 0.0
+        # Share of requests answered with `error_status`, and share that time out instead
+        self.error_rate = 0.0
+        self.error_status = 500
+        self.timeout_rate = 0.0
+        # Statuses to answer the next requests with, before serving normally again
+        self._queued_errors: list[int] = []
+
+        self.requests = 0
+        self.requests_by_route: Counter[str] = Counter()
+
+        self.users = [
+            {"id": user_id, "name": f"User {user_id}", "username": f"user{user_id}"}
+            for user_id in range(1, users + 1)
+        ]
+        self.labels: dict[int, dict] = {
+            label_id: {
+                "id": label_id,
+                "title": f"Label {label_id}",
+                "description": "",
+                "hex_color": LABEL_COLORS[label_id % len(LABEL_COLORS)],
+                "created_by": self.users[0] if self.users else {},
+                "created": _format_date(self._now),
+                "updated": _format_date(self._now),
+            }
+            for label_id in range(1, labels + 1)
+        }
+        self.projects: dict[int, dict] = {}
+        self.tasks: dict[int, dict] = {}
+
+        for project_id in range(1, projects + 1):
+            self.projects[project_id] = {
+                "id": project_id,
+                "title": f"Project {project_id}",
+                "description": "",
+                "is_archived": False,
+                "hex_color": "",
+                "owner": self.users[0] if self.users else {},
+                "created": _format_date(self._now),
+                "updated": _format_date(self._now),
+            }
+
+        ratios = (done_ratio, due_ratio, repeat_ratio, label_ratio, assignee_ratio)
+        for task_id in range(1, tasks + 1):
+            self.tasks[task_id] = self._generate_task(task_id, (task_id - 1) % projects + 1, *ratios)
+        self._next_task_id = tasks + 1
+
+    def _generate_task(self, task_id: int, project_id: int, done_ratio: float, due_ratio: float,
+                       repeat_ratio: float, label_ratio: float, assignee_ratio: float) -> dict:
+        rand = self._random.random
+        due_date = self._now + timedelta(hours=self._random.randint(-72, 720)) if rand() < due_ratio else None
+        labels = (
+            self._random.sample(list(self.labels.values()), self._random.randint(1, min(3, len(self.labels))))
+            if self.labels and rand() < label_ratio else None
+        )
+        assignees = [self._random.choice(self.users)] if self.users and rand() < assignee_ratio else None
+
+        return self._task_defaults({
+            "id": task_id,
+            "title": f"Task {task_id}",
+            "done": rand() < done_ratio,
+            "due_date": _format_date(due_date),
+            "project_id": project_id,
+            "priority": self._random.randint(0, 5),
+            "repeat_after": self._random.choice([3600, 86400, 604800]) if rand() < repeat_ratio else 0,
+            "labels": labels,
+            "assignees": assignees,
+        })
+
+    def _task_defaults(self, task: dict) -> dict:
+        return {
+            "title": "",
+            "description": "",
+            "done": False,
+            "done_at": NO_DATE,
+            "due_date": NO_DATE,
+            "start_date": NO_DATE,
+            "end_date": NO_DATE,
+            "priority": 0,
+            "repeat_after": 0,
+            "repeat_mode": 0,
+            "percent_done": 0,
+            "hex_color": "",
+            "is_favorite": False,
+            "labels": None,
+            "assignees": None,
+            "created": _format_date(self._now),
+            "updated": _format_date(self._now),
+            **task,
+        }
+
+    def touch(self, count: int) -> list[int]:
+        """Change the title of `count` random tasks, like edits made in Vikunja between polls."""
+        self._now += timedelta(minutes=1)
+        task_ids = self._random.sample(sorted(self.tasks), min(count, len(self.tasks)))
+        for task_id in task_ids:
+            task = self.tasks[task_id]
+            task["title"] = f"Task {task_id} ({_format_date(self._now)})"
+            task["updated"] = _format_date(self._now)
+        return task_ids
+
+    def fail_next(self, count: int, status: int = 500) -> None:
+        """Answer the next `count` requests with `status`, to test retries."""
+        self._queued_errors.extend([status] * count)
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport to build the integration's httpx client with."""
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer one API request, after the configured latency."""
+        self.requests += 1
+        path = request.url.path.removeprefix("/api/v1")
+        parts = path.strip("/").split("/")
+        self.requests_by_route[f"{request.method} /{'/'.join('{id}' if p.isdigit() else p for p in parts)}"] += 1
+
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self._faults.random() * self.jitter)
+
+        if self._faults.random() < self.timeout_rate:
+            raise httpx.ReadTimeout("Injected timeout", request=request)
+        if self._queued_errors:
+            return self._error(self._queued_errors.pop(0), "Injected error")
+        if self._faults.random() < self.error_rate:
+            return self._error(self.error_status, "Injected error")
+
+        if not request.headers.get("authorization", "").startswith("Bearer "):
+            return self._error(401, "missing, malformed, expired or otherwise invalid token provided")
+
+        body = json.loads(request.content) if request.content else {}
+        return self._route(request, parts, body)
+
+    def _route(self, request: httpx.Request, parts: list[str], body: dict) -> httpx.Response:
+        method = request.method
+
+        if parts == ["projects"] and method == "GET":
+            return self._paginate(request, list(self.projects.values()))
+
+        if len(parts) == 3 and parts[0] == "projects" and parts[2] == "tasks":
+            project_id = int(parts[1])
+            if project_id not in self.projects:
+                return self._error(404, "The project does not exist.")
+            if method == "GET":
+                return self._paginate(
+                    request, [task for task in self.tasks.values() if task["project_id"] == project_id]
+                )
+            if method == "PUT":
+                return self._json(self._create_task(project_id, body), status_code=201)
+
+        if parts == ["tasks", "all"] and method == "GET":
+            tasks = list(self.tasks.values())
+            match = UPDATED_FILTER.search(request.url.params.get("filter", ""))
+            if match:
+                since = _parse_date(match.group(1))
+                tasks = [task for task in tasks if _parse_date(task["updated"]) >= since]
+            return self._paginate(request, tasks)
+
+        if len(parts) == 2 and parts[0] == "tasks":
+            task_id = int(parts[1])
+            if task_id not in self.tasks:
+                return self._error(404, "The task does not exist.")
+            if method == "GET":
+                return self._json(self.tasks[task_id])
+            if method == "POST":
+                return self._json(self._update_task(task_id, body))
+            if method == "DELETE":
+                del self.tasks[task_id]
+                return self._json({"message": "Successfully deleted."})
+
+        if parts == ["labels"]:
+            if method == "GET":
+                return self._paginate(request, list(self.labels.values()))
+            if method == "PUT":
+                label_id = max(self.labels, default=0) + 1
+                self.labels[label_id] = {**body, "id": label_id, "created": _format_date(self._now),
+                                         "updated": _format_date(self._now)}
+                return self._json(self.labels[label_id], status_code=201)
+
+        if len(parts) == 2 and parts[0] == "labels":
+            label_id = int(parts[1])
+            if label_id not in self.labels:
+                return self._error(404, "The label does not exist.")
+            if method == "GET":
+                return self._json(self.labels[label_id])
+            if method in ("PUT", "POST"):
+                self.labels[label_id].update({**body, "id": label_id, "updated": _format_date(self._now)})
+                return self._json(self.labels[label_id])
+            if method == "DELETE":
+                del self.labels[label_id]
+                return self._json({"message": "Successfully deleted."})
+
+        return self._error(404, "Not found")
+
+    def _create_task(self, project_id: int, body: dict) -> dict:
+        task_id = self._next_task_id
+        self._next_task_id += 1
+        self.tasks[task_id] = self._task_defaults({**body, "id": task_id, "project_id": project_id})
+        return self.tasks[task_id]
+
+    def _update_task(self, task_id: int, body: dict) -> dict:
+        # Like Vikunja, labels and assignees are managed through their own endpoints
+        changes = {key: value for key, value in body.items() if key not in ("id", "labels", "assignees", "created")}
+        task = self.tasks[task_id]
+        task.update(changes)
+        if changes.get("done") and task["done_at"] == NO_DATE:
+            task["done_at"] = _format_date(self._now)
+        task["updated"] = _format_date(self._now)
+        return task
+
+    def _paginate(self, request: httpx.Request, items: list) -> httpx.Response:
+        per_page = min(int(request.url.params.get("per_page", self.max_per_page)), self.max_per_page)
+        page = int(request.url.params.get("page", 1))
+        total_pages = max(1, math.ceil(len(items) / per_page))
+        return self._json(
+            items[(page - 1) * per_page:page * per_page],
+            headers={"x-pagination-total-pages": str(total_pages), "x-pagination-result-count": str(len(items))},
+        )
+
+    @staticmethod
+    def _json(data, status_code: int = 200, headers: Optional[dict] = None) -> httpx.Response:
+        return httpx.Response(status_code, content=json.dumps(data).encode(), headers={
+            "content-type": "application/json", **(headers or {})
+        })
+
+    @staticmethod
+    def _error(status_code: int, message: str) -> httpx.Response:
+        return httpx.Response(status_code, json={"code": status_code, "message": message})
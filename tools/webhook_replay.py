@@ -0,0 +1,48 @@
+"""Replay recorded Vikunja webhook payloads against a Home Assistant webhook URL.
+
+Usage:
+    python tools/webhook_replay.py http://homeassistant.local:8123/api/webhook/<id>
+    python tools/webhook_replay.py <url> --secret mysecret tools/payloads/2_task_updated.json
+
+Without payload files every recording in tools/payloads is sent, in name order.
+"""
+import argparse
+import hashlib
+import hmac
+import sys
+from pathlib import Path
+
+import httpx
+
+PAYLOAD_DIR = Path(__file__).parent / "payloads"
+SIGNATURE_HEADER = "X-Vikunja-Signature"
+
+
+def replay(url: str, payloads: list[Path], secret: str | None) -> bool:
+    ok = True
+    with httpx.Client(timeout=10) as client:
+        for path in payloads:
+            body = path.read_bytes()
+            headers = {"Content-Type": "application/json"}
+            if secret:
+                headers[SIGNATURE_HEADER] = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+            response = client.post(url, content=body, headers=headers)
+            print(f"{path.name}: {response.status_code}")
+            ok = ok and response.is_success
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("url", help="Home Assistant webhook URL of the Vikunja entry")
+    parser.add_argument("payloads", nargs="*", type=Path, help="Recorded payload files to send")
+    parser.add_argument("--secret", help="Sign the payloads like a Vikunja webhook with this secret")
+    args = parser.parse_args()
+
+    payloads = args.payloads or sorted(PAYLOAD_DIR.glob("*.json"))
+    return 0 if replay(args.url, payloads, args.secret) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())